@@ -3,25 +3,52 @@ Dataset API endpoints.
 Handles dataset listing and detailed dataset operations.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import Optional, Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
+from fastapi.responses import ORJSONResponse
+from typing import Optional, Dict, Any, List, Literal
 
 from src.services.database import get_database, DatabaseService
-from src.models.api import DatasetListResponse, DatasetImagesResponse
+from src.models.api import DatasetListResponse, DatasetImagesResponse, JOB_STATUS_COMPLETED, JOB_STATUS_FAILED
+from src.utils.cache import TTLCache
 from src.utils.logging import logger
-from src.utils.exceptions import DatabaseError
+from src.utils.exceptions import DatabaseError, ValidationError
 
 
 router = APIRouter()
 
+# Allowed values for sorting and filtering query parameters
+SortOrder = Literal["asc", "desc"]
+DatasetSortField = Literal["created_at", "completed_at", "name"]
+ImageSortField = Literal["filename", "file_size_bytes", "annotation_count", "processed_at"]
+# Datasets are only stored once an import finishes
+DatasetStatus = Literal["completed", "failed"]
+ImageListFormat = Literal["full", "compact"]
 
-@router.get("", response_model=DatasetListResponse)
+# Column order of positional rows in the compact image listing format
+COMPACT_IMAGE_FIELDS = (
+    "id", "filename", "width", "height", "file_size_bytes",
+    "image_url", "annotations", "annotation_count"
+)
+COMPACT_ANNOTATION_FIELDS = ("class_id", "class_name", "center_x", "center_y", "width", "height")
+
+# Short-lived cache for dataset detail lookups. Datasets are written by the
+# worker process, so only datasets in a terminal status (which no longer
+# change) are cached; any other status is always read fresh.
+DATASET_CACHE_TTL_SECONDS = 10
+DATASET_CACHEABLE_STATUSES = frozenset({JOB_STATUS_COMPLETED, JOB_STATUS_FAILED})
+_dataset_cache = TTLCache(maxsize=1024, ttl=DATASET_CACHE_TTL_SECONDS)
+
+
+# Read endpoints document their models via `responses` rather than
+# `response_model`, so trusted database output isn't re-validated per request
+@router.get("", responses={200: {"model": DatasetListResponse}})
 async def list_datasets(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (deprecated, use cursor)"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
-    sort_by: str = Query("created_at", description="Sort field"),
-    sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    cursor: Optional[str] = Query(None, description="Cursor from previous page's next_cursor"),
+    sort_by: DatasetSortField = Query("created_at", description="Sort field"),
+    sort_order: SortOrder = Query("desc", description="Sort order"),
+    status: Optional[DatasetStatus] = Query(None, description="Filter by status"),
     db: DatabaseService = Depends(get_database)
 ) -> Dict[str, Any]:
     """
@@ -41,6 +68,9 @@ async def list_datasets(
             filters["status"] = status
         
         # Get datasets from database
+        if cursor:
+            filters["cursor"] = cursor
+        
         result = await db.list_datasets(page=page, limit=limit, **filters)
         
         # Add filters applied info
@@ -53,6 +83,8 @@ async def list_datasets(
         logger.info(f"Retrieved {len(result['datasets'])} datasets")
         return result
         
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except DatabaseError as e:
         logger.error(f"Database error listing datasets: {e}")
         raise HTTPException(status_code=500, detail="Database error occurred")
@@ -64,25 +96,36 @@ async def list_datasets(
 @router.get("/{dataset_id}")
 async def get_dataset(
     dataset_id: str,
+    response: Response,
     db: DatabaseService = Depends(get_database)
 ) -> Dict[str, Any]:
     """
     Get detailed information about a specific dataset.
     
     Returns complete dataset metadata including statistics and class information.
+    Completed and failed datasets are cached for a few seconds.
     """
     try:
         logger.info(f"Getting dataset details: {dataset_id}")
         
-        dataset = await db.get_dataset(dataset_id)
-        
-        if not dataset:
-            logger.warning(f"Dataset not found: {dataset_id}")
-            raise HTTPException(
-                status_code=404, 
-                detail=f"Dataset with ID '{dataset_id}' not found"
-            )
+        dataset = _dataset_cache.get(dataset_id)
+        if dataset is None:
+            dataset = await db.get_dataset(dataset_id)
+            
+            if not dataset:
+                logger.warning(f"Dataset not found: {dataset_id}")
+                raise HTTPException(
+                    status_code=404, 
+                    detail=f"Dataset with ID '{dataset_id}' not found"
+                )
+            
+            if dataset.get("status") in DATASET_CACHEABLE_STATUSES:
+                _dataset_cache.set(dataset_id, dataset)
         
+        if dataset.get("status") in DATASET_CACHEABLE_STATUSES:
+            response.headers["Cache-Control"] = f"public, max-age={DATASET_CACHE_TTL_SECONDS}"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
         logger.info(f"Retrieved dataset: {dataset['name']}")
         return dataset
         
@@ -96,17 +139,19 @@ async def get_dataset(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/{dataset_id}/images", response_model=DatasetImagesResponse)
+@router.get("/{dataset_id}/images", responses={200: {"model": DatasetImagesResponse}})
 async def list_dataset_images(
     dataset_id: str,
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (deprecated, use cursor)"),
     limit: int = Query(50, ge=1, le=200, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from previous page's next_cursor"),
     class_filter: Optional[str] = Query(None, description="Filter by class name"),
     has_annotations: Optional[bool] = Query(None, description="Filter by annotation presence"),
-    sort_by: str = Query("filename", description="Sort field"),
-    sort_order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
+    sort_by: ImageSortField = Query("filename", description="Sort field"),
+    sort_order: SortOrder = Query("asc", description="Sort order"),
+    format: ImageListFormat = Query("full", description="Response format (compact returns positional rows)"),
     db: DatabaseService = Depends(get_database)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     List images with annotations for a specific dataset.
     
@@ -116,15 +161,6 @@ async def list_dataset_images(
     try:
         logger.info(f"Listing images for dataset {dataset_id}: page={page}, limit={limit}")
         
-        # Verify dataset exists
-        dataset = await db.get_dataset(dataset_id)
-        if not dataset:
-            logger.warning(f"Dataset not found: {dataset_id}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Dataset with ID '{dataset_id}' not found"
-            )
-        
         # Build filters
         filters = {
             "sort_by": sort_by,
@@ -134,6 +170,8 @@ async def list_dataset_images(
             filters["class_filter"] = class_filter
         if has_annotations is not None:
             filters["has_annotations"] = has_annotations
+        if cursor:
+            filters["cursor"] = cursor
         
         # Get images from database
         result = await db.list_dataset_images(
@@ -143,14 +181,61 @@ async def list_dataset_images(
             **filters
         )
         
+        # Dataset existence is checked in the same database call
+        if result is None:
+            logger.warning(f"Dataset not found: {dataset_id}")
+            raise HTTPException(
+                status_code=404,
+                detail=f"Dataset with ID '{dataset_id}' not found"
+            )
+        
         logger.info(f"Retrieved {len(result['images'])} images for dataset {dataset_id}")
-        return result
+        
+        if format == "compact":
+            result["fields"] = {
+                "image": COMPACT_IMAGE_FIELDS,
+                "annotation": COMPACT_ANNOTATION_FIELDS
+            }
+            result["images"] = _compact_images(result["images"])
+        
+        # Encode the annotation-dense page directly, skipping FastAPI's
+        # per-field response serialization
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except DatabaseError as e:
         logger.error(f"Database error listing images for dataset {dataset_id}: {e}")
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
         logger.error(f"Unexpected error listing images for dataset {dataset_id}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+def _compact_images(images: List[Dict[str, Any]]) -> List[list]:
+    """Convert image documents to positional rows (see COMPACT_*_FIELDS)."""
+    return [
+        [
+            image["id"],
+            image["filename"],
+            image["width"],
+            image["height"],
+            image["file_size_bytes"],
+            image["image_url"],
+            [
+                [
+                    annotation["class_id"],
+                    annotation["class_name"],
+                    annotation["bbox"]["center_x"],
+                    annotation["bbox"]["center_y"],
+                    annotation["bbox"]["width"],
+                    annotation["bbox"]["height"]
+                ]
+                for annotation in image["annotations"]
+            ],
+            image["annotation_count"]
+        ]
+        for image in images
+    ]
@@ -3,8 +3,9 @@ Health check API endpoints.
 Provides service health monitoring and dependency status.
 """
 
-from fastapi import APIRouter
-from datetime import datetime
+import asyncio
+from fastapi import APIRouter, Response
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 from src.models.api import HealthResponse
@@ -12,14 +13,19 @@ from src.config import settings
 from src.services.database import health_check_database
 from src.services.job_queue import health_check_queue
 from src.services.storage import health_check_storage
+from src.utils.cache import TTLCache
 from src.utils.logging import logger
 
 
 router = APIRouter()
 
+# Health is polled frequently by load balancers; reuse results briefly
+HEALTH_CACHE_TTL_SECONDS = 1
+_health_cache = TTLCache(maxsize=1, ttl=HEALTH_CACHE_TTL_SECONDS)
+
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> Dict[str, Any]:
+async def health_check(response: Response) -> Dict[str, Any]:
     """
     Comprehensive health check for the service and its dependencies.
     
@@ -29,14 +35,29 @@ async def health_check() -> Dict[str, Any]:
     - Storage service (Local/Cloud Storage)
     
     Returns overall health status and individual dependency statuses.
+    Results are cached for one second.
     """
+    response.headers["Cache-Control"] = f"max-age={HEALTH_CACHE_TTL_SECONDS}"
+    
+    cached = _health_cache.get("health")
+    if cached is not None:
+        return cached
+    
+    now = datetime.now(timezone.utc)
+    
     try:
         logger.debug("Performing health check")
         
-        # Check all dependencies
-        db_health = await health_check_database()
-        queue_health = await health_check_queue()
-        storage_health = await health_check_storage()
+        # Check all dependencies concurrently
+        db_health, queue_health, storage_health = [
+            {"status": "unhealthy", "error": str(result)} if isinstance(result, Exception) else result
+            for result in await asyncio.gather(
+                health_check_database(),
+                health_check_queue(),
+                health_check_storage(),
+                return_exceptions=True
+            )
+        ]
         
         # Determine overall health
         dependencies = {
@@ -60,15 +81,15 @@ async def health_check() -> Dict[str, Any]:
                     errors.append(f"Storage: {storage_health['error']}")
         
         # Build response
-        response = {
+        result = {
             "status": "healthy" if overall_healthy else "unhealthy",
-            "timestamp": datetime.utcnow(),
+            "timestamp": now,
             "version": settings.api_version,
             "dependencies": dependencies
         }
         
         if errors:
-            response["errors"] = errors
+            result["errors"] = errors
         
         # Log health check result
         if overall_healthy:
@@ -76,13 +97,14 @@ async def health_check() -> Dict[str, Any]:
         else:
             logger.warning(f"Health check failed: {errors}")
         
-        return response
+        _health_cache.set("health", result)
+        return result
         
     except Exception as e:
         logger.error(f"Health check error: {e}")
         return {
             "status": "unhealthy",
-            "timestamp": datetime.utcnow(),
+            "timestamp": now,
             "version": settings.api_version,
             "dependencies": {
                 "mongodb": "unknown",
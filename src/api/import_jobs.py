@@ -4,18 +4,47 @@ Handles dataset import initiation and job status tracking.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from collections import deque
+import os
+import threading
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from src.models.api import ImportRequest, ImportResponse, JobStatusResponse
+from src.models.api import (
+    ImportRequest, ImportResponse, JobStatusResponse, ImportJobPayload,
+    JOB_STATUS_QUEUED, JOB_STATUS_COMPLETED, JOB_STATUS_FAILED
+)
 from src.services.job_queue import get_job_queue, JobQueue
 from src.services.database import get_database, DatabaseService
+from src.services.job_status_cache import get_job_status_cache, JobStatusCache
 from src.utils.logging import logger
 from src.utils.exceptions import DatabaseError, ProcessingError
 
 router = APIRouter()
 
+# Job IDs are drawn from a pool refilled by a single bulk random read
+JOB_ID_POOL_SIZE = 256
+_job_id_pool: deque = deque()
+_job_id_pool_lock = threading.Lock()
+
+
+def _next_job_id() -> str:
+    """Return a random (version 4) UUID string for a new import job."""
+    try:
+        return _job_id_pool.popleft()
+    except IndexError:
+        pass
+    
+    with _job_id_pool_lock:
+        if not _job_id_pool:
+            random_bytes = os.urandom(16 * JOB_ID_POOL_SIZE)
+            _job_id_pool.extend(
+                str(uuid.UUID(bytes=random_bytes[i:i + 16], version=4))
+                for i in range(0, len(random_bytes), 16)
+            )
+        return _job_id_pool.popleft()
+
 
 @router.post("/import", response_model=ImportResponse, status_code=202)
 async def import_dataset(
@@ -31,35 +60,38 @@ async def import_dataset(
     """
     try:
         # Generate unique job ID
-        job_id = str(uuid.uuid4())
+        job_id = _next_job_id()
         
         logger.info(f"Starting dataset import: {request.name} (job: {job_id})")
         
+        # All request fields are plain strings, so the dump is BSON-safe
+        request_payload = request.model_dump()
+        now = datetime.now(timezone.utc)
+        
         # Create job record in database
         job_data = {
             "job_id": job_id,
-            "status": "queued",
+            "status": JOB_STATUS_QUEUED,
             "progress": {
                 "percentage": 0,
                 "current_step": "queued",
                 "steps_completed": [],
                 "total_steps": 6
             },
-            "request": request.model_dump(mode="json"),
-            "created_at": datetime.utcnow(),
-            "estimated_completion": datetime.utcnow() + timedelta(minutes=20)
+            "request": request_payload,
+            "created_at": now,
+            "estimated_completion": now + timedelta(minutes=20)
         }
         
         await db.create_import_job(job_data)
         
         # Enqueue background processing job
-
-        await job_queue.enqueue_import_job(job_id, request.model_dump(mode="json"))
+        await job_queue.enqueue_import_job(ImportJobPayload.from_request(job_id, request))
         
         # Return response
         response = {
             "job_id": job_id,
-            "status": "queued",
+            "status": JOB_STATUS_QUEUED,
             "message": "Import job started successfully",
             "created_at": job_data["created_at"],
             "estimated_completion": job_data["estimated_completion"]
@@ -82,7 +114,8 @@ async def import_dataset(
 @router.get("/import/{job_id}/status", response_model=JobStatusResponse)
 async def get_import_status(
     job_id: str,
-    db: DatabaseService = Depends(get_database)
+    db: DatabaseService = Depends(get_database),
+    cache: Optional[JobStatusCache] = Depends(get_job_status_cache)
 ) -> Dict[str, Any]:
     """
     Get the status and progress of a dataset import job.
@@ -93,8 +126,14 @@ async def get_import_status(
     try:
         logger.debug(f"Getting status for import job: {job_id}")
         
-        # Get job from database
-        job = await db.get_import_job(job_id)
+        # Clients poll this endpoint; serve recent reads from the cache
+        job = await cache.get(job_id) if cache else None
+        
+        if job is None:
+            job = await db.get_import_job(job_id)
+            
+            if job and cache:
+                await cache.set(job_id, job)
         
         if not job:
             logger.warning(f"Import job not found: {job_id}")
@@ -114,7 +153,7 @@ async def get_import_status(
         }
         
         # Add dataset_id if completed
-        if job["status"] == "completed" and job.get("dataset_id"):
+        if job["status"] == JOB_STATUS_COMPLETED and job.get("dataset_id"):
             response["dataset_id"] = job["dataset_id"]
         
         # Add summary if completed
@@ -122,7 +161,7 @@ async def get_import_status(
             response["summary"] = job["summary"]
         
         # Add error details if failed
-        if job["status"] == "failed" and job.get("error"):
+        if job["status"] == JOB_STATUS_FAILED and job.get("error"):
             response["error"] = job["error"]
         
         logger.debug(f"Retrieved status for job {job_id}: {job['status']}")
@@ -7,7 +7,7 @@ import os
 from enum import Enum
 from typing import Optional
 from pydantic_settings import BaseSettings
-from pydantic import field_validator
+from pydantic import field_validator, model_validator
 
 
 class Environment(str, Enum):
@@ -28,12 +28,20 @@ class Settings(BaseSettings):
     
     # Database Configuration
     mongodb_url: str = "mongodb://localhost:27017/yolo_datasets"
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 10
+    mongo_max_idle_time_ms: int = 30000
+    mongo_wait_queue_timeout_ms: int = 5000
+    mongo_server_selection_timeout_ms: int = 5000
+    mongo_compressors: str = "zstd,zlib"
     
     # Local Development (Celery + Redis)
     redis_url: Optional[str] = None
+    job_status_cache_ttl_seconds: int = 3
     
     # Storage Configuration
     storage_path: str = "./storage"  # Local storage path for development
+    image_upload_concurrency: int = 32  # Images processed/uploaded at once per import
     
     # Production (GCP)
     gcp_project: Optional[str] = None
@@ -49,21 +57,14 @@ class Settings(BaseSettings):
             return Environment(v.lower())
         return v
     
-    @field_validator('redis_url')
-    @classmethod
-    def validate_redis_url_for_local(cls, v, info):
-        """Ensure Redis URL is provided for local environment."""
-        if info.data.get('environment') == Environment.LOCAL and not v:
-            return "redis://localhost:6379/0"
-        return v
-    
-    @field_validator('gcp_project')
-    @classmethod
-    def validate_gcp_project_for_production(cls, v, info):
-        """Ensure GCP project is provided for production environment."""
-        if info.data.get('environment') == Environment.PRODUCTION and not v:
+    @model_validator(mode='after')
+    def apply_environment_defaults(self) -> 'Settings':
+        """Apply environment-dependent defaults and requirements in one pass."""
+        if self.environment == Environment.LOCAL and not self.redis_url:
+            self.redis_url = "redis://localhost:6379/0"
+        elif self.environment == Environment.PRODUCTION and not self.gcp_project:
             raise ValueError("GCP_PROJECT is required for production environment")
-        return v
+        return self
     
     model_config = {
         "env_file": ".env",
@@ -75,12 +76,16 @@ class Settings(BaseSettings):
 # Global settings instance
 settings = Settings()
 
+# Environment flags, computed once at import time
+IS_LOCAL = settings.environment is Environment.LOCAL
+IS_PRODUCTION = settings.environment is Environment.PRODUCTION
+
 
 def is_local_environment() -> bool:
     """Check if running in local development environment."""
-    return settings.environment == Environment.LOCAL
+    return IS_LOCAL
 
 
 def is_production_environment() -> bool:
     """Check if running in production environment."""
-    return settings.environment == Environment.PRODUCTION
+    return IS_PRODUCTION
@@ -3,18 +3,24 @@ FastAPI main application for YOLO Dataset Management API.
 Handles HTTP requests and coordinates with background processing.
 """
 
+import os
+import orjson
 import uvicorn
+from datetime import datetime, timezone
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
-from src.config import settings, is_local_environment
+from src.config import settings, IS_LOCAL
 from src.api.datasets import router as datasets_router
 from src.api.import_jobs import router as import_jobs_router
 from src.api.health import router as health_router
 from src.services.database import init_database, close_database
-from src.utils.logging import setup_logging, logger
+from src.services.job_queue import get_job_queue
+from src.services.job_status_cache import close_job_status_cache
+from src.utils.logging import setup_logging, stop_logging, logger
 from src.utils.exceptions import YOLODatasetError
 
 
@@ -34,11 +40,21 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         raise
     
+    # Build the job queue client up front so the first import request
+    # doesn't pay the Celery / Cloud Tasks client construction cost
+    try:
+        get_job_queue()
+        logger.info("Job queue initialized successfully")
+    except Exception as e:
+        logger.warning(f"Job queue unavailable at startup: {e}")
+    
     yield
     
     # Shutdown
     logger.info("Shutting down YOLO Dataset Management API")
     await close_database()
+    await close_job_status_cache()
+    stop_logging()
 
 
 # Create FastAPI application
@@ -46,13 +62,14 @@ app = FastAPI(
     title="YOLO Dataset Management API",
     description="Backend API for importing and managing YOLO format datasets up to 100GB",
     version=settings.api_version,
-    docs_url="/docs" if is_local_environment() else None,
-    redoc_url="/redoc" if is_local_environment() else None,
+    docs_url="/docs" if IS_LOCAL else None,
+    redoc_url="/redoc" if IS_LOCAL else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Add CORS middleware for local development
-if is_local_environment():
+if IS_LOCAL:
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -61,18 +78,21 @@ if is_local_environment():
         allow_headers=["*"],
     )
 
+# Compress larger JSON payloads (image listings); small responses skip it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 
 # Global exception handler
 @app.exception_handler(YOLODatasetError)
 async def yolo_dataset_exception_handler(request, exc: YOLODatasetError):
     """Handle custom YOLO dataset exceptions."""
     logger.error(f"YOLO Dataset Error: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={
             "error": exc.__class__.__name__.lower(),
             "message": str(exc),
-            "timestamp": "2025-07-03T10:00:00Z"
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
 
@@ -81,35 +101,39 @@ async def yolo_dataset_exception_handler(request, exc: YOLODatasetError):
 async def global_exception_handler(request, exc: Exception):
     """Handle unexpected exceptions."""
     logger.error(f"Unexpected error: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "internal_server_error",
             "message": "An unexpected error occurred",
-            "timestamp": "2025-07-03T10:00:00Z"
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
 
 
+# Root endpoint payload never changes, so encode it once
+_ROOT_BYTES = orjson.dumps({
+    "service": "YOLO Dataset Management API",
+    "version": settings.api_version,
+    "description": "Backend API for importing and managing YOLO format datasets",
+    "documentation": {
+        "interactive": "/docs",
+        "redoc": "/redoc",
+        "openapi": "/openapi.json"
+    },
+    "health": "/health",
+    "contact": {
+        "support": "support@example.com",
+        "repository": "https://github.com/your-org/yolo-dataset-management"
+    }
+})
+
+
 # Root endpoint
 @app.get("/")
 async def root():
     """API information endpoint."""
-    return {
-        "service": "YOLO Dataset Management API",
-        "version": settings.api_version,
-        "description": "Backend API for importing and managing YOLO format datasets",
-        "documentation": {
-            "interactive": "/docs",
-            "redoc": "/redoc",
-            "openapi": "/openapi.json"
-        },
-        "health": "/health",
-        "contact": {
-            "support": "support@example.com",
-            "repository": "https://github.com/your-org/yolo-dataset-management"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # Include API routers
@@ -124,5 +148,9 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         log_level=settings.log_level.lower(),
-        reload=is_local_environment()
+        reload=IS_LOCAL,
+        loop="uvloop",
+        http="httptools",
+        # Hot reload requires a single process; production uses every core
+        workers=1 if IS_LOCAL else (os.cpu_count() or 2)
     )
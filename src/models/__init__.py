@@ -3,23 +3,28 @@ Data models for YOLO Dataset Management API.
 Includes API request/response models, database models, and YOLO format models.
 """
 
-from .api import *
-from .database import *
-from .yolo import *
+import importlib
 
 __all__ = [
     # API Models
     "ImportRequest",
     "ImportResponse", 
     "ImportJobData",
+    "ImportJobPayload",
     "JobStatus",
     "JobStatusResponse",
+    "JobError",
+    "ImportSummary",
+    "DatasetStats",
     "DatasetListResponse",
     "DatasetImagesResponse",
     "HealthResponse",
     
     # Database Models
     "PyObjectId",
+    "BBox",
+    "Annotation",
+    "StoragePaths",
     "Dataset",
     "ImportJob",
     "Image",
@@ -30,3 +35,40 @@ __all__ = [
     "YOLOConfig",
     "YOLODataset"
 ]
+
+# Submodule defining each exported model. Models are imported on first
+# access so that e.g. importing src.models.yolo doesn't build every API and
+# database model schema (shared types live in src.models.common).
+_MODEL_MODULES = {
+    "ImportRequest": ".api",
+    "ImportResponse": ".api",
+    "ImportJobData": ".api",
+    "ImportJobPayload": ".api",
+    "JobStatus": ".api",
+    "JobStatusResponse": ".api",
+    "JobError": ".common",
+    "ImportSummary": ".api",
+    "DatasetStats": ".api",
+    "DatasetListResponse": ".api",
+    "DatasetImagesResponse": ".api",
+    "HealthResponse": ".api",
+    "PyObjectId": ".database",
+    "BBox": ".common",
+    "Annotation": ".database",
+    "StoragePaths": ".database",
+    "Dataset": ".database",
+    "ImportJob": ".database",
+    "Image": ".database",
+    "YOLOBoundingBox": ".yolo",
+    "YOLOAnnotation": ".yolo",
+    "YOLOConfig": ".yolo",
+    "YOLODataset": ".yolo",
+}
+
+
+def __getattr__(name):
+    """Lazily import models from their defining submodule."""
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -3,18 +3,23 @@ API request and response models for YOLO Dataset Management.
 Defines the structure of HTTP requests and responses.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl, field_validator
-from enum import Enum
+from typing import List, Optional, Dict, Any, Annotated, Final, Literal
+from pydantic import BaseModel, Field, StringConstraints, field_validator
 
+from src.models.common import JobError, BBox
+
+
+# http(s) URL, checked with a single pattern match in pydantic-core
+URLStr = Annotated[str, StringConstraints(pattern=r"^https?://[^\s]+$", max_length=2048)]
 
 class ImportRequest(BaseModel):
     """Request model for dataset import."""
     name: str = Field(..., min_length=1, max_length=255, description="Dataset name")
     description: Optional[str] = Field(None, max_length=1000, description="Dataset description")
-    yolo_config_url: HttpUrl = Field(..., description="URL to YOLO config file (dataset.yaml)")
-    dataset_url: HttpUrl = Field(..., description="URL to complete YOLO dataset archive (.zip)")
+    yolo_config_url: URLStr = Field(..., description="URL to YOLO config file (dataset.yaml)")
+    dataset_url: URLStr = Field(..., description="URL to complete YOLO dataset archive (.zip)")
     
     @field_validator('name')
     @classmethod
@@ -36,6 +41,40 @@ class ImportRequest(BaseModel):
     }
 
 
+@dataclass(frozen=True)
+class ImportJobPayload:
+    """Import job payload built once from a validated request and handed to the job queue."""
+    
+    __slots__ = ("job_id", "name", "description", "config_url", "dataset_url")
+    
+    job_id: str
+    name: str
+    description: Optional[str]
+    config_url: str
+    dataset_url: str
+    
+    @classmethod
+    def from_request(cls, job_id: str, request: ImportRequest) -> "ImportJobPayload":
+        """Build payload from an already validated import request."""
+        return cls(
+            job_id=job_id,
+            name=request.name,
+            description=request.description,
+            config_url=request.yolo_config_url,
+            dataset_url=request.dataset_url
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Queue message body (same shape as ImportJobData)."""
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "description": self.description,
+            "config_url": self.config_url,
+            "dataset_url": self.dataset_url
+        }
+
+
 class ImportJobData(BaseModel):
     """Data structure for background job processing."""
     job_id: str = Field(..., description="Unique job identifier")
@@ -66,12 +105,13 @@ class ImportResponse(BaseModel):
     }
 
 
-class JobStatus(str, Enum):
-    """Enumeration of possible job statuses."""
-    QUEUED = "queued"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
+# Possible job statuses (checked by pydantic-core as a literal set)
+JobStatus = Literal["queued", "processing", "completed", "failed"]
+
+JOB_STATUS_QUEUED: Final = "queued"
+JOB_STATUS_PROCESSING: Final = "processing"
+JOB_STATUS_COMPLETED: Final = "completed"
+JOB_STATUS_FAILED: Final = "failed"
 
 
 class JobProgress(BaseModel):
@@ -83,6 +123,27 @@ class JobProgress(BaseModel):
     total_steps: int = Field(default=6, description="Total number of processing steps")
 
 
+class ImportSummary(BaseModel):
+    """Summary recorded on a completed job."""
+    total_images: int = Field(..., ge=0, description="Number of imported images")
+    total_annotations: int = Field(..., ge=0, description="Number of imported annotations")
+    classes: List[str] = Field(default_factory=list, description="Class names")
+    dataset_size_bytes: int = Field(..., ge=0, description="Total image size in bytes")
+    
+    model_config = {"extra": "allow"}
+
+
+class DatasetStats(BaseModel):
+    """Dataset statistics computed at import time."""
+    total_images: int = Field(0, ge=0, description="Number of images")
+    total_annotations: int = Field(0, ge=0, description="Number of annotations")
+    classes_count: int = Field(0, ge=0, description="Number of classes")
+    dataset_size_bytes: int = Field(0, ge=0, description="Total image size in bytes")
+    avg_annotations_per_image: float = Field(0, ge=0, description="Average annotations per image")
+    
+    model_config = {"extra": "allow"}
+
+
 class JobStatusResponse(BaseModel):
     """Response model for job status queries."""
     job_id: str = Field(..., description="Job identifier")
@@ -92,8 +153,8 @@ class JobStatusResponse(BaseModel):
     started_at: Optional[datetime] = Field(None, description="Job start timestamp")
     completed_at: Optional[datetime] = Field(None, description="Job completion timestamp")
     estimated_completion: Optional[datetime] = Field(None, description="Estimated completion time")
-    error: Optional[Dict[str, Any]] = Field(None, description="Error details (if failed)")
-    summary: Optional[Dict[str, Any]] = Field(None, description="Import summary (if completed)")
+    error: Optional[JobError] = Field(None, description="Error details (if failed)")
+    summary: Optional[ImportSummary] = Field(None, description="Import summary (if completed)")
 
 
 class PaginationInfo(BaseModel):
@@ -104,6 +165,7 @@ class PaginationInfo(BaseModel):
     total_items: int = Field(..., ge=0, description="Total number of items")
     has_next: bool = Field(..., description="Whether there is a next page")
     has_prev: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for fetching the next page")
 
 
 class DatasetSummary(BaseModel):
@@ -114,7 +176,7 @@ class DatasetSummary(BaseModel):
     status: str = Field(..., description="Dataset status")
     created_at: datetime = Field(..., description="Creation timestamp")
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
-    stats: Dict[str, Any] = Field(..., description="Dataset statistics")
+    stats: DatasetStats = Field(..., description="Dataset statistics")
     classes: List[str] = Field(..., description="Class names")
 
 
@@ -129,7 +191,7 @@ class ImageAnnotation(BaseModel):
     """Image annotation model."""
     class_id: int = Field(..., ge=0, description="Class identifier")
     class_name: str = Field(..., description="Class name")
-    bbox: Dict[str, float] = Field(..., description="Bounding box coordinates (YOLO format)")
+    bbox: BBox = Field(..., description="Bounding box coordinates (YOLO format)")
 
 
 class ImageInfo(BaseModel):
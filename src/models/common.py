@@ -0,0 +1,32 @@
+"""
+Model types shared by the API, database and YOLO models.
+Kept separate so importing one model module doesn't build the others.
+"""
+
+from typing import Optional, Annotated
+from pydantic import BaseModel, Field
+
+
+# Normalized YOLO coordinate, range-checked by pydantic-core
+NormalizedCoordinate = Annotated[float, Field(ge=0.0, le=1.0)]
+
+
+class JobError(BaseModel):
+    """Error details recorded on a failed job."""
+    code: str = Field(..., description="Error code")
+    message: str = Field(..., description="Human-readable error message")
+    details: Optional[str] = Field(None, description="Additional error details")
+    timestamp: Optional[str] = Field(None, description="Failure timestamp (ISO 8601)")
+    
+    model_config = {"extra": "allow"}
+
+
+class BBox(BaseModel):
+    """Bounding box in YOLO format (shared by image documents and API responses)."""
+    
+    center_x: NormalizedCoordinate
+    center_y: NormalizedCoordinate
+    width: NormalizedCoordinate
+    height: NormalizedCoordinate
+    
+    model_config = {"extra": "forbid"}
@@ -6,7 +6,9 @@ Defines the structure of documents stored in the database.
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Annotated
 from bson import ObjectId
-from pydantic import BaseModel, Field, field_validator, PlainValidator, WithJsonSchema
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, WithJsonSchema
+
+from src.models.common import BBox, JobError
 
 
 def validate_object_id(v: Any) -> ObjectId:
@@ -18,14 +20,38 @@ def validate_object_id(v: Any) -> ObjectId:
     raise ValueError("Invalid ObjectId")
 
 
+def serialize_object_id(v: ObjectId) -> str:
+    """Serialize ObjectId values as hex strings."""
+    return str(v)
+
+
 # Create the PyObjectId type using Pydantic v2 API
 PyObjectId = Annotated[
     ObjectId,
     PlainValidator(validate_object_id),
+    PlainSerializer(serialize_object_id, return_type=str, when_used="json"),
     WithJsonSchema({"type": "string"}, mode="serialization"),
 ]
 
 
+class StoragePaths(BaseModel):
+    """Cloud Storage locations of a dataset's files."""
+    
+    images_path: Optional[str] = Field(None, description="Images prefix")
+    labels_path: Optional[str] = Field(None, description="Labels prefix")
+    config_path: Optional[str] = Field(None, description="dataset.yaml path")
+    
+    model_config = {"extra": "allow"}
+
+
+class Annotation(BaseModel):
+    """Annotation embedded in image documents."""
+    
+    class_id: int = Field(..., ge=0, description="Class identifier")
+    class_name: str = Field(..., description="Class name")
+    bbox: BBox = Field(..., description="Bounding box coordinates")
+
+
 class Dataset(BaseModel):
     """Database model for datasets collection."""
     
@@ -44,12 +70,11 @@ class Dataset(BaseModel):
     classes: List[Dict[str, Any]] = Field(default_factory=list, description="Class definitions")
     
     # Cloud Storage paths (NO file data in MongoDB)
-    storage: Dict[str, str] = Field(default_factory=dict, description="Storage paths")
+    storage: StoragePaths = Field(default_factory=StoragePaths, description="Storage paths")
     
     model_config = {
         "populate_by_name": True,
         "arbitrary_types_allowed": True,
-        "json_encoders": {ObjectId: str},
         "json_schema_extra": {
             "example": {
                 "name": "Traffic Detection Dataset",
@@ -101,12 +126,11 @@ class ImportJob(BaseModel):
     dataset_id: Optional[PyObjectId] = Field(None, description="Created dataset ID")
     
     # Error info (populated on failure)
-    error: Optional[Dict[str, Any]] = Field(None, description="Error details")
+    error: Optional[JobError] = Field(None, description="Error details")
     
     model_config = {
         "populate_by_name": True,
-        "arbitrary_types_allowed": True,
-        "json_encoders": {ObjectId: str}
+        "arbitrary_types_allowed": True
     }
 
 
@@ -126,7 +150,7 @@ class Image(BaseModel):
     image_url: str = Field(..., description="Cloud storage URL")
     
     # YOLO annotations (embedded for fast access)
-    annotations: List[Dict[str, Any]] = Field(default_factory=list, description="YOLO annotations")
+    annotations: List[Annotation] = Field(default_factory=list, description="YOLO annotations")
     
     # Quick stats
     annotation_count: int = Field(..., ge=0, description="Number of annotations")
@@ -134,34 +158,9 @@ class Image(BaseModel):
     # Processing metadata
     processed_at: datetime = Field(default_factory=datetime.utcnow, description="Processing timestamp")
     
-    @field_validator('annotations')
-    @classmethod
-    def validate_annotations(cls, v):
-        """Validate annotation format."""
-        for annotation in v:
-            required_fields = ['class_id', 'class_name', 'bbox']
-            for field in required_fields:
-                if field not in annotation:
-                    raise ValueError(f"Missing required field: {field}")
-            
-            # Validate bounding box format
-            bbox = annotation['bbox']
-            required_bbox_fields = ['center_x', 'center_y', 'width', 'height']
-            for field in required_bbox_fields:
-                if field not in bbox:
-                    raise ValueError(f"Missing bbox field: {field}")
-                
-                # Validate normalized coordinates (0.0 to 1.0)
-                value = bbox[field]
-                if not isinstance(value, (int, float)) or not 0.0 <= value <= 1.0:
-                    raise ValueError(f"Invalid bbox coordinate: {field}={value}")
-        
-        return v
-    
     model_config = {
         "populate_by_name": True,
         "arbitrary_types_allowed": True,
-        "json_encoders": {ObjectId: str},
         "json_schema_extra": {
             "example": {
                 "dataset_id": "507f1f77bcf86cd799439011",
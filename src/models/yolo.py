@@ -5,29 +5,29 @@ YOLO format models and validation.
 Defines the structure of YOLO datasets, annotations, and configuration files.
 """
 
-from typing import List, Dict, Any, Optional, Union
-from pydantic import BaseModel, Field, field_validator
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 import yaml
 from io import StringIO
 
+from src.models.common import NormalizedCoordinate
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAMLLoader, CSafeDumper as _YAMLDumper
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader, SafeDumper as _YAMLDumper
+
 
 class YOLOBoundingBox(BaseModel):
     """YOLO bounding box with normalized coordinates."""
     
-    center_x: float = Field(..., description="Normalized center X coordinate (0.0-1.0)")
-    center_y: float = Field(..., description="Normalized center Y coordinate (0.0-1.0)")
-    width: float = Field(..., description="Normalized width (0.0-1.0)")
-    height: float = Field(..., description="Normalized height (0.0-1.0)")
-    
-    @field_validator('center_x', 'center_y', 'width', 'height')
-    @classmethod
-    def validate_normalized_coords(cls, v):
-        """Validate that coordinates are normalized between 0.0 and 1.0."""
-        if not isinstance(v, (int, float)):
-            raise ValueError('Coordinate must be a number')
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('YOLO coordinates must be normalized (0.0-1.0)')
-        return float(v)
+    center_x: NormalizedCoordinate = Field(..., description="Normalized center X coordinate (0.0-1.0)")
+    center_y: NormalizedCoordinate = Field(..., description="Normalized center Y coordinate (0.0-1.0)")
+    width: NormalizedCoordinate = Field(..., description="Normalized width (0.0-1.0)")
+    height: NormalizedCoordinate = Field(..., description="Normalized height (0.0-1.0)")
     
     def to_absolute(self, image_width: int, image_height: int) -> Dict[str, int]:
         """Convert normalized coordinates to absolute pixel coordinates."""
@@ -40,16 +40,22 @@ class YOLOBoundingBox(BaseModel):
     
     def to_xyxy(self, image_width: int, image_height: int) -> Dict[str, int]:
         """Convert to top-left, bottom-right coordinates."""
-        abs_coords = self.to_absolute(image_width, image_height)
-        half_width = abs_coords["width"] // 2
-        half_height = abs_coords["height"] // 2
+        x1, y1, x2, y2 = self.to_xyxy_tuple(image_width, image_height)
+        return {"x1": x1, "y1": y1, "x2": x2, "y2": y2}
+    
+    def to_xyxy_tuple(self, image_width: int, image_height: int) -> Tuple[int, int, int, int]:
+        """Convert to (x1, y1, x2, y2) without building a dict, for bulk export."""
+        center_x = int(self.center_x * image_width)
+        center_y = int(self.center_y * image_height)
+        half_width = int(self.width * image_width) // 2
+        half_height = int(self.height * image_height) // 2
         
-        return {
-            "x1": abs_coords["center_x"] - half_width,
-            "y1": abs_coords["center_y"] - half_height,
-            "x2": abs_coords["center_x"] + half_width,
-            "y2": abs_coords["center_y"] + half_height
-        }
+        return (
+            center_x - half_width,
+            center_y - half_height,
+            center_x + half_width,
+            center_y + half_height
+        )
     
     model_config = {
         "json_schema_extra": {
@@ -82,34 +88,12 @@ class YOLOAnnotation(BaseModel):
     @classmethod
     def from_yolo_line(cls, line: str, class_names: List[str]) -> 'YOLOAnnotation':
         """Parse YOLO annotation from text line."""
-        parts = line.strip().split()
-        if len(parts) < 5:
+        annotations, errors = parse_yolo_annotations(line, class_names)
+        if errors:
+            raise ValueError(errors[0][1])
+        if not annotations:
             raise ValueError(f"Invalid YOLO annotation line: {line}")
-        
-        try:
-            class_id = int(parts[0])
-            center_x = float(parts[1])
-            center_y = float(parts[2])
-            width = float(parts[3])
-            height = float(parts[4])
-            confidence = float(parts[5]) if len(parts) > 5 else None
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Invalid YOLO annotation format: {line}") from e
-        
-        if class_id >= len(class_names):
-            raise ValueError(f"Class ID {class_id} exceeds available classes")
-        
-        return cls(
-            class_id=class_id,
-            class_name=class_names[class_id],
-            bbox=YOLOBoundingBox(
-                center_x=center_x,
-                center_y=center_y,
-                width=width,
-                height=height
-            ),
-            confidence=confidence
-        )
+        return annotations[0]
     
     def to_yolo_line(self) -> str:
         """Convert annotation to YOLO text format."""
@@ -130,6 +114,8 @@ class YOLOConfig(BaseModel):
     # Real ultralytics format uses names as dict, not nc + names list
     names: Union[List[str], Dict[int, str]] = Field(..., description="Class names (list or dict)")
     
+    _class_names: Tuple[str, ...] = PrivateAttr(default=())
+    
     # Computed property for number of classes
     @property
     def nc(self) -> int:
@@ -140,15 +126,20 @@ class YOLOConfig(BaseModel):
     
     @property
     def class_names(self) -> List[str]:
-        """Get class names as a list."""
+        """Get class names as a list (a copy; cached configs are shared)."""
+        return list(self._class_names)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the class names once, immutably; the config is frozen afterwards."""
         if isinstance(self.names, dict):
             # Convert dict to sorted list by key
             max_key = max(self.names.keys()) if self.names else -1
             result = [""] * (max_key + 1)
             for idx, name in self.names.items():
                 result[idx] = name
-            return result
-        return self.names
+            self._class_names = tuple(result)
+        else:
+            self._class_names = tuple(self.names)
     
     @field_validator('names')
     @classmethod
@@ -188,27 +179,22 @@ class YOLOConfig(BaseModel):
     
     @classmethod
     def from_yaml(cls, yaml_content: str) -> 'YOLOConfig':
-        """Parse YOLO config from YAML content."""
-        try:
-            data = yaml.safe_load(yaml_content)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML format: {e}")
-        
-        if not isinstance(data, dict):
-            raise ValueError("YAML content must be a dictionary")
-        
-        # Validate required fields
-        if 'names' not in data:
-            raise ValueError("Missing required field: names")
-        
-        return cls(**data)
+        """Parse YOLO config from YAML content (cached, configs are frozen)."""
+        return _config_from_yaml(cls, yaml_content)
     
     def to_yaml(self) -> str:
         """Convert config to YAML format."""
-        data = self.model_dump(exclude_none=True)
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        # Built directly instead of via model_dump(exclude_none=True)
+        data = {
+            key: value
+            for key, value in (("path", self.path), ("train", self.train), ("val", self.val), ("test", self.test))
+            if value is not None
+        }
+        data["names"] = self.names
+        return yaml.dump(data, Dumper=_YAMLDumper, default_flow_style=False, sort_keys=False)
     
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "path": "/path/to/dataset",
@@ -225,6 +211,24 @@ class YOLOConfig(BaseModel):
     }
 
 
+@lru_cache(maxsize=128)
+def _config_from_yaml(cls: type, yaml_content: str) -> YOLOConfig:
+    """Parse and validate YAML content; identical content reuses the config."""
+    try:
+        data = yaml.load(yaml_content, Loader=_YAMLLoader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML format: {e}")
+    
+    if not isinstance(data, dict):
+        raise ValueError("YAML content must be a dictionary")
+    
+    # Validate required fields
+    if 'names' not in data:
+        raise ValueError("Missing required field: names")
+    
+    return cls(**data)
+
+
 class YOLODataset(BaseModel):
     """Complete YOLO dataset with config, images, and annotations."""
     
@@ -244,12 +248,13 @@ class YOLODataset(BaseModel):
             return v
         
         class_names = config.class_names
+        num_classes = len(class_names)
         for filename, annotations in v.items():
             for annotation in annotations:
-                if annotation.class_id >= len(class_names):
+                if annotation.class_id >= num_classes:
                     raise ValueError(
                         f"Invalid class_id {annotation.class_id} in {filename}. "
-                        f"Max class_id should be {len(class_names) - 1}"
+                        f"Max class_id should be {num_classes - 1}"
                     )
                 
                 expected_name = class_names[annotation.class_id]
@@ -267,11 +272,12 @@ class YOLODataset(BaseModel):
         total_annotations = sum(len(annotations) for annotations in self.annotations.values())
         
         # Class distribution
-        class_names = self.config.class_names
-        class_counts = {name: 0 for name in class_names}
-        for annotations in self.annotations.values():
-            for annotation in annotations:
-                class_counts[annotation.class_name] += 1
+        counts = Counter(
+            annotation.class_name
+            for annotations in self.annotations.values()
+            for annotation in annotations
+        )
+        class_counts = {name: counts[name] for name in self.config.class_names}
         
         # Image dimensions statistics
         if self.images:
@@ -308,7 +314,7 @@ class YOLODataset(BaseModel):
         
         # Check for images without annotations
         image_filenames = {img.get('filename', '') for img in self.images}
-        annotation_filenames = set(self.annotations.keys())
+        annotation_filenames = self.annotations.keys()  # set-like view, no copy
         
         missing_annotations = image_filenames - annotation_filenames
         if missing_annotations:
@@ -318,22 +324,78 @@ class YOLODataset(BaseModel):
         if missing_images:
             issues.append(f"Annotations without images: {len(missing_images)} files")
         
-        # Check for invalid coordinates
-        invalid_coords = []
-        for filename, annotations in self.annotations.items():
-            for i, annotation in enumerate(annotations):
-                try:
-                    # This will validate the coordinates
-                    annotation.bbox.model_dump()
-                except ValueError as e:
-                    invalid_coords.append(f"{filename}[{i}]: {e}")
-        
-        if invalid_coords:
-            issues.append(f"Invalid coordinates in {len(invalid_coords)} annotations")
-        
+        # Coordinates are range-checked when annotations are parsed or validated,
+        # so there is no per-annotation pass here
         return issues
 
 
+def parse_yolo_annotations(
+    text: str,
+    class_names: List[str]
+) -> Tuple[List[YOLOAnnotation], List[Tuple[int, str]]]:
+    """
+    Parse the contents of a YOLO label file in one pass.
+    
+    Lines are range- and class-name-checked here and the models are built
+    with model_construct, so no validators run per annotation. Blank lines are
+    skipped; invalid lines are reported as (line_number, message) pairs.
+    """
+    annotations = []
+    errors = []
+    names = [name.strip() for name in class_names]
+    num_classes = len(names)
+    construct_bbox = YOLOBoundingBox.model_construct
+    construct_annotation = YOLOAnnotation.model_construct
+    
+    for line_num, line in enumerate(text.splitlines(), 1):
+        parts = line.split()
+        if not parts:
+            continue
+        if len(parts) < 5:
+            errors.append((line_num, f"Invalid YOLO annotation line: {line.strip()}"))
+            continue
+    
+        try:
+            class_id = int(parts[0])
+            center_x = float(parts[1])
+            center_y = float(parts[2])
+            width = float(parts[3])
+            height = float(parts[4])
+            confidence = float(parts[5]) if len(parts) > 5 else None
+        except ValueError:
+            errors.append((line_num, f"Invalid YOLO annotation format: {line.strip()}"))
+            continue
+    
+        if not 0 <= class_id < num_classes:
+            errors.append((line_num, f"Class ID {class_id} exceeds available classes"))
+            continue
+        if not names[class_id]:
+            # Gaps in dict-style names leave empty slots in class_names
+            errors.append((line_num, f"Class ID {class_id} has no class name"))
+            continue
+        if not (0.0 <= center_x <= 1.0 and 0.0 <= center_y <= 1.0
+                and 0.0 <= width <= 1.0 and 0.0 <= height <= 1.0):
+            errors.append((line_num, "YOLO coordinates must be normalized (0.0-1.0)"))
+            continue
+        if confidence is not None and not 0.0 <= confidence <= 1.0:
+            errors.append((line_num, "Confidence must be between 0.0 and 1.0"))
+            continue
+    
+        annotations.append(construct_annotation(
+            class_id=class_id,
+            class_name=names[class_id],
+            bbox=construct_bbox(
+                center_x=center_x,
+                center_y=center_y,
+                width=width,
+                height=height
+            ),
+            confidence=confidence
+        ))
+    
+    return annotations, errors
+
+
 # Helper functions for coordinate conversion
 def convert_yolo_to_absolute(bbox: YOLOBoundingBox, image_width: int, image_height: int) -> Dict[str, int]:
     """Convert YOLO normalized coordinates to absolute coordinates."""
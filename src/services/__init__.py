@@ -5,8 +5,8 @@ Contains business logic and external service integrations.
 
 from .job_queue import get_job_queue, JobQueue
 from .storage import get_storage_service, StorageService
-from .dataset_processor import DatasetProcessor
 from .database import get_database, DatabaseService, init_database, close_database
+from .job_status_cache import get_job_status_cache, JobStatusCache
 
 __all__ = [
     "get_job_queue",
@@ -17,5 +17,15 @@ __all__ = [
     "get_database",
     "DatabaseService",
     "init_database",
-    "close_database"
+    "close_database",
+    "get_job_status_cache",
+    "JobStatusCache"
 ]
+
+
+def __getattr__(name):
+    """Lazily import worker-only services so the API process doesn't load them."""
+    if name == "DatasetProcessor":
+        from .dataset_processor import DatasetProcessor
+        return DatasetProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,13 +7,38 @@ import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from bson import ObjectId
+from bson import ObjectId, json_util
+from pymongo import IndexModel
+import base64
 import math
 
 from src.config import settings
 from src.models.database import Dataset, ImportJob, Image, DATASETS_COLLECTION, IMPORT_JOBS_COLLECTION, IMAGES_COLLECTION
 from src.utils.logging import logger
-from src.utils.exceptions import DatabaseError
+from src.utils.exceptions import DatabaseError, ValidationError
+
+# Images per insert_many call when bulk-creating images
+IMAGE_INSERT_CHUNK_SIZE = 10000
+
+# Chunk inserts in flight at once, so large imports don't exhaust the connection
+# pool and time out in its wait queue
+IMAGE_INSERT_CONCURRENCY = 4
+
+# Fields left out of list responses (they match the documented list item models;
+# full documents are still returned by the detail endpoints)
+DATASET_LIST_EXCLUDED_FIELDS = ("import_job_id", "storage")
+IMAGE_LIST_EXCLUDED_FIELDS = ("dataset_id", "processed_at")
+
+# Value types a keyset cursor may carry for each sortable field
+CURSOR_VALUE_TYPES = {
+    "created_at": (datetime,),
+    "completed_at": (datetime,),
+    "processed_at": (datetime,),
+    "name": (str,),
+    "filename": (str,),
+    "file_size_bytes": (int, float),
+    "annotation_count": (int, float),
+}
 
 
 class DatabaseService:
@@ -33,26 +58,50 @@ class DatabaseService:
     
     async def ensure_indexes(self) -> None:
         """Create database indexes for optimal performance."""
-        try:
-            # Datasets collection indexes
-            await self.datasets.create_index([("status", 1), ("created_at", -1)])
-            await self.datasets.create_index([("created_at", -1)])
-            await self.datasets.create_index([("import_job_id", 1)])
-            
-            # Import jobs collection indexes
-            await self.datasets.create_index([("job_id", 1)], unique=True)
-            await self.import_jobs.create_index([("status", 1), ("created_at", -1)])
-            await self.import_jobs.create_index([("dataset_id", 1)])
-            
-            # Images collection indexes (critical for 100GB datasets)
-            await self.images.create_index([("dataset_id", 1), ("filename", 1)])
-            await self.images.create_index([("dataset_id", 1), ("annotation_count", 1)])
-            await self.images.create_index([("dataset_id", 1), ("processed_at", -1)])
-            
+        # Datasets collection indexes. List queries sort on the requested
+        # field with _id as tie-breaker, so indexes end in _id to avoid
+        # in-memory sorts (either direction can use the same index).
+        dataset_indexes = [
+            IndexModel([("status", 1), ("created_at", -1), ("_id", -1)]),
+            IndexModel([("created_at", -1), ("_id", -1)]),
+            IndexModel([("completed_at", -1), ("_id", -1)]),
+            IndexModel([("name", 1), ("_id", 1)]),
+            IndexModel([("import_job_id", 1)])
+        ]
+        
+        # Import jobs collection indexes
+        import_job_indexes = [
+            IndexModel([("job_id", 1)], unique=True),
+            IndexModel([("status", 1), ("created_at", -1)]),
+            IndexModel([("dataset_id", 1)])
+        ]
+        
+        # Images collection indexes (critical for 100GB datasets)
+        image_indexes = [
+            IndexModel([("dataset_id", 1), ("filename", 1), ("_id", 1)]),
+            IndexModel([("dataset_id", 1), ("annotation_count", 1), ("_id", 1)]),
+            IndexModel([("dataset_id", 1), ("file_size_bytes", 1), ("_id", 1)]),
+            IndexModel([("dataset_id", 1), ("processed_at", -1), ("_id", -1)]),
+            IndexModel([("dataset_id", 1), ("annotations.class_name", 1), ("filename", 1), ("_id", 1)])
+        ]
+        
+        # One createIndexes command per collection, all collections concurrently
+        collections = (self.datasets, self.import_jobs, self.images)
+        results = await asyncio.gather(
+            self.datasets.create_indexes(dataset_indexes),
+            self.import_jobs.create_indexes(import_job_indexes),
+            self.images.create_indexes(image_indexes),
+            return_exceptions=True
+        )
+        
+        failed = False
+        for collection, result in zip(collections, results):
+            if isinstance(result, Exception):
+                failed = True
+                logger.warning(f"Failed to create indexes on {collection.name}: {result}")
+        
+        if not failed:
             logger.info("Database indexes created successfully")
-            
-        except Exception as e:
-            logger.warning(f"Failed to create some indexes: {e}")
     
     # Dataset operations
     async def create_dataset(self, dataset_data: Dict[str, Any]) -> str:
@@ -84,49 +133,61 @@ class DatabaseService:
             logger.error(f"Failed to get dataset {dataset_id}: {e}")
             raise DatabaseError(f"Dataset retrieval failed: {e}")
     
-    async def list_datasets(self, page: int = 1, limit: int = 20, **filters) -> Dict[str, Any]:
-        """List datasets with pagination and filtering."""
+    async def list_datasets(self, page: int = 1, limit: int = 20, cursor: Optional[str] = None, **filters) -> Dict[str, Any]:
+        """
+        List datasets with pagination and filtering.
+        
+        When a cursor from a previous response is given, keyset pagination is
+        used instead of skip/limit and the page number is ignored.
+        """
         try:
             # Build query from filters
             query = {}
             if filters.get("status"):
                 query["status"] = filters["status"]
             
-            # Calculate pagination
-            skip = (page - 1) * limit
-            
-            # Build sort criteria
+            # Build sort criteria (_id breaks ties so the cursor is stable)
             sort_by = filters.get("sort_by", "created_at")
             sort_order = -1 if filters.get("sort_order", "desc") == "desc" else 1
-            sort_criteria = [(sort_by, sort_order)]
-            
-            # Execute queries
-            cursor = self.datasets.find(query).sort(sort_criteria).skip(skip).limit(limit)
-            datasets = await cursor.to_list(length=limit)
+            sort_criteria = [(sort_by, sort_order), ("_id", sort_order)]
+            
+            # Execute page query and count concurrently (the whole page arrives in one batch).
+            # Unfiltered listings use the collection metadata count instead of an index walk.
+            page_query = _apply_cursor(query, cursor, sort_by, sort_order)
+            skip = 0 if cursor else (page - 1) * limit
+            projection = {field: 0 for field in DATASET_LIST_EXCLUDED_FIELDS if field != sort_by}
+            find_cursor = self.datasets.find(page_query, projection).sort(sort_criteria).skip(skip).limit(limit + 1).batch_size(limit + 1)
+            count = self.datasets.count_documents(query) if query else self.datasets.estimated_document_count()
+            datasets, total_items = await asyncio.gather(
+                find_cursor.to_list(length=limit + 1),
+                count
+            )
             
-            # Count total items
-            total_items = await self.datasets.count_documents(query)
             total_pages = math.ceil(total_items / limit)
             
-            # Format datasets
-            formatted_datasets = []
+            has_next = len(datasets) > limit
+            del datasets[limit:]
+            next_cursor = _encode_cursor(datasets[-1], sort_by) if has_next else None
+            
+            # Format datasets in place
             for dataset in datasets:
-                dataset["id"] = str(dataset["_id"])
-                del dataset["_id"]
-                formatted_datasets.append(dataset)
+                dataset["id"] = str(dataset.pop("_id"))
             
             return {
-                "datasets": formatted_datasets,
+                "datasets": datasets,
                 "pagination": {
                     "page": page,
                     "limit": limit,
                     "total_pages": total_pages,
                     "total_items": total_items,
-                    "has_next": page < total_pages,
-                    "has_prev": page > 1
+                    "has_next": has_next,
+                    "has_prev": cursor is not None or page > 1,
+                    "next_cursor": next_cursor
                 }
             }
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Failed to list datasets: {e}")
             raise DatabaseError(f"Dataset listing failed: {e}")
@@ -186,13 +247,30 @@ class DatabaseService:
             if not images_data:
                 return []
             
-            # Convert dataset_id strings to ObjectId
+            # Convert dataset_id strings to ObjectId (a batch almost always shares one dataset)
+            dataset_oids: Dict[str, ObjectId] = {}
             for image in images_data:
-                if isinstance(image.get("dataset_id"), str):
-                    image["dataset_id"] = ObjectId(image["dataset_id"])
-            
-            result = await self.images.insert_many(images_data)
-            image_ids = [str(oid) for oid in result.inserted_ids]
+                dataset_id = image.get("dataset_id")
+                if isinstance(dataset_id, str):
+                    oid = dataset_oids.get(dataset_id)
+                    if oid is None:
+                        oid = dataset_oids[dataset_id] = ObjectId(dataset_id)
+                    image["dataset_id"] = oid
+            
+            # Unordered inserts let the server apply each chunk without serializing;
+            # large imports are split into chunks, a few inserted concurrently
+            chunks = [
+                images_data[i:i + IMAGE_INSERT_CHUNK_SIZE]
+                for i in range(0, len(images_data), IMAGE_INSERT_CHUNK_SIZE)
+            ]
+            semaphore = asyncio.Semaphore(IMAGE_INSERT_CONCURRENCY)
+            
+            async def insert_chunk(chunk: List[Dict[str, Any]]):
+                async with semaphore:
+                    return await self.images.insert_many(chunk, ordered=False)
+            
+            results = await asyncio.gather(*(insert_chunk(chunk) for chunk in chunks))
+            image_ids = [str(oid) for result in results for oid in result.inserted_ids]
             
             logger.info(f"Created {len(image_ids)} images")
             return image_ids
@@ -201,11 +279,18 @@ class DatabaseService:
             logger.error(f"Failed to create images: {e}")
             raise DatabaseError(f"Image creation failed: {e}")
     
-    async def list_dataset_images(self, dataset_id: str, page: int = 1, limit: int = 50, **filters) -> Dict[str, Any]:
-        """List images for a dataset with pagination and filtering."""
+    async def list_dataset_images(self, dataset_id: str, page: int = 1, limit: int = 50,
+                                  cursor: Optional[str] = None, **filters) -> Optional[Dict[str, Any]]:
+        """
+        List images for a dataset with pagination and filtering.
+        
+        Returns None if the dataset does not exist, so callers don't need a
+        separate existence lookup. When a cursor from a previous response is
+        given, keyset pagination is used instead of skip/limit.
+        """
         try:
             if not ObjectId.is_valid(dataset_id):
-                raise DatabaseError(f"Invalid dataset ID: {dataset_id}")
+                return None
             
             # Build query
             query = {"dataset_id": ObjectId(dataset_id)}
@@ -220,40 +305,46 @@ class DatabaseService:
                 else:
                     query["annotation_count"] = 0
             
-            # Calculate pagination
-            skip = (page - 1) * limit
-            
-            # Build sort criteria
+            # Build sort criteria (_id breaks ties so the cursor is stable)
             sort_by = filters.get("sort_by", "filename")
             sort_order = 1 if filters.get("sort_order", "asc") == "asc" else -1
-            sort_criteria = [(sort_by, sort_order)]
+            sort_criteria = [(sort_by, sort_order), ("_id", sort_order)]
+            
+            # Execute existence check, page query and count concurrently
+            page_query = _apply_cursor(query, cursor, sort_by, sort_order)
+            skip = 0 if cursor else (page - 1) * limit
+            projection = {field: 0 for field in IMAGE_LIST_EXCLUDED_FIELDS if field != sort_by}
+            find_cursor = self.images.find(page_query, projection).sort(sort_criteria).skip(skip).limit(limit + 1).batch_size(limit + 1)
+            dataset_count, images, total_items = await asyncio.gather(
+                self.datasets.count_documents({"_id": query["dataset_id"]}, limit=1),
+                find_cursor.to_list(length=limit + 1),
+                self.images.count_documents(query)
+            )
             
-            # Execute queries
-            cursor = self.images.find(query).sort(sort_criteria).skip(skip).limit(limit)
-            images = await cursor.to_list(length=limit)
+            if not dataset_count:
+                return None
             
-            # Count total items
-            total_items = await self.images.count_documents(query)
             total_pages = math.ceil(total_items / limit)
             
-            # Format images
-            formatted_images = []
+            has_next = len(images) > limit
+            del images[limit:]
+            next_cursor = _encode_cursor(images[-1], sort_by) if has_next else None
+            
+            # Format images in place (dataset_id is reported once, at the top level)
             for image in images:
-                image["id"] = str(image["_id"])
-                image["dataset_id"] = str(image["dataset_id"])
-                del image["_id"]
-                formatted_images.append(image)
+                image["id"] = str(image.pop("_id"))
             
             return {
                 "dataset_id": dataset_id,
-                "images": formatted_images,
+                "images": images,
                 "pagination": {
                     "page": page,
                     "limit": limit,
                     "total_pages": total_pages,
                     "total_items": total_items,
-                    "has_next": page < total_pages,
-                    "has_prev": page > 1
+                    "has_next": has_next,
+                    "has_prev": cursor is not None or page > 1,
+                    "next_cursor": next_cursor
                 },
                 "filters_applied": {
                     "class_filter": filters.get("class_filter"),
@@ -261,11 +352,60 @@ class DatabaseService:
                 }
             }
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Failed to list images for dataset {dataset_id}: {e}")
             raise DatabaseError(f"Image listing failed: {e}")
 
 
+def _encode_cursor(document: Dict[str, Any], sort_by: str) -> str:
+    """Build an opaque keyset cursor from the last document of a page."""
+    payload = json_util.dumps([document.get(sort_by), document["_id"]])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _apply_cursor(query: Dict[str, Any], cursor: Optional[str], sort_by: str, sort_order: int) -> Dict[str, Any]:
+    """
+    Return query restricted to documents after the cursor position.
+    
+    The cursor is client input, so only an ObjectId and a scalar of the sort
+    field's type are accepted before anything is placed in the query. Documents
+    with a null or missing sort value sort before all others in MongoDB, so
+    they come first in ascending order and last in descending order.
+    """
+    if not cursor:
+        return query
+    
+    try:
+        last_value, last_id = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValidationError("Invalid pagination cursor", field="cursor", value=cursor)
+    
+    allowed_types = CURSOR_VALUE_TYPES.get(sort_by, ())
+    valid_value = last_value is None or (
+        isinstance(last_value, allowed_types) and not isinstance(last_value, bool)
+    )
+    if not isinstance(last_id, ObjectId) or not valid_value:
+        raise ValidationError("Invalid pagination cursor", field="cursor", value=cursor)
+    
+    op = "$gt" if sort_order == 1 else "$lt"
+    if last_value is None:
+        # Remaining null-valued documents, then (ascending only) every non-null one
+        conditions = [{sort_by: None, "_id": {op: last_id}}]
+        if sort_order == 1:
+            conditions.append({sort_by: {"$ne": None}})
+    else:
+        conditions = [
+            {sort_by: {op: last_value}},
+            {sort_by: last_value, "_id": {op: last_id}}
+        ]
+        if sort_order == -1:
+            conditions.append({sort_by: None})
+    
+    return {**query, "$or": conditions}
+
+
 # Global database service instance
 _database_service: Optional[DatabaseService] = None
 _client: Optional[AsyncIOMotorClient] = None
@@ -278,8 +418,16 @@ async def init_database() -> None:
     try:
         logger.info(f"Connecting to MongoDB: {settings.mongodb_url}")
         
-        # Create MongoDB client
-        _client = AsyncIOMotorClient(settings.mongodb_url)
+        # Create a single pooled MongoDB client shared by the whole process
+        _client = AsyncIOMotorClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+            waitQueueTimeoutMS=settings.mongo_wait_queue_timeout_ms,
+            serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+            compressors=settings.mongo_compressors
+        )
         
         # Test connection
         await _client.admin.command('ping')
@@ -4,22 +4,32 @@ Handles downloading, parsing, and storing YOLO format datasets.
 """
 
 import asyncio
+import logging
 import zipfile
 import tempfile
 import yaml
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, AsyncIterator
-from datetime import datetime
+from typing import Dict, Any, List, Tuple, AsyncIterator, Awaitable
+from datetime import datetime, timezone
 from PIL import Image
 
-from src.models.yolo import YOLOConfig, YOLOAnnotation, YOLOBoundingBox
+from src.config import settings
+from src.models.yolo import YOLOConfig, YOLOAnnotation, YOLOBoundingBox, parse_yolo_annotations
 from src.services.storage import get_storage_service
 from src.services.database import get_database
+from src.services.job_status_cache import get_job_status_cache
 from src.utils.logging import logger
 from src.utils.exceptions import ProcessingError, ValidationError
 
 
+# Parsed annotations keyed by image stem, produced while images upload
+AnnotationsFuture = Awaitable[Dict[str, List[YOLOAnnotation]]]
+
+
 class DatasetProcessor:
     """Processes YOLO dataset imports with support for 100GB datasets."""
     
@@ -27,6 +37,7 @@ class DatasetProcessor:
         """Initialize dataset processor with required services."""
         self.storage = get_storage_service()
         self.db = get_database()
+        self.job_status_cache = get_job_status_cache()
         
     async def process_dataset_import(self, job_id: str, data: Dict[str, Any]) -> None:
         """
@@ -44,20 +55,39 @@ class DatasetProcessor:
             await self._update_progress(job_id, 30, "downloading_dataset", "Downloading YOLO dataset archive")
             dataset_dir = await self._download_and_extract_dataset(data["dataset_url"], job_id)
             
-            # Step 3: Find and parse YOLO annotations
-            await self._update_progress(job_id, 60, "parsing_annotations", "Parsing YOLO annotations")
-            annotations = await self._find_and_parse_annotations(dataset_dir, config)
+            # Index the extracted tree once for both labels and images
+            dataset_root = self._find_dataset_root(dataset_dir)
+            label_files, image_files = _index_dataset(dataset_root)
             
-            # Step 4: Process and validate images
-            await self._update_progress(job_id, 80, "processing_images", "Processing images")
-            images = await self._find_and_process_images(dataset_dir, annotations)
+            # Steps 3-4: parse labels in a worker thread while images are probed and
+            # uploaded; image records only wait for the labels once their upload is done
+            await self._update_progress(job_id, 60, "parsing_annotations", "Parsing YOLO annotations")
+            uploaded_paths: List[str] = []
+            annotations_task = asyncio.create_task(
+                asyncio.to_thread(self._parse_yolo_annotations, label_files, config)
+            )
+            images_task = asyncio.create_task(
+                self._find_and_process_images(dataset_root, image_files, annotations_task, uploaded_paths)
+            )
+            try:
+                annotations = await annotations_task
+                self._validate_annotations(dataset_root, annotations)
+                
+                await self._update_progress(job_id, 80, "processing_images", "Processing images")
+                images = await images_task
+            except BaseException:
+                # Stop in-flight uploads and wait for them before removing what was uploaded
+                images_task.cancel()
+                await asyncio.gather(images_task, return_exceptions=True)
+                await self._delete_uploads(uploaded_paths)
+                raise
             
             # Step 5: Store dataset in database and storage
             await self._update_progress(job_id, 90, "storing_data", "Storing dataset")
-            dataset_id = await self._store_dataset(job_id, data, config, images, annotations)
+            dataset_id, stats = await self._store_dataset(job_id, data, config, images)
             
             # Step 6: Complete
-            await self._complete_job(job_id, dataset_id, config, images, annotations)
+            await self._complete_job(job_id, dataset_id, config, stats)
             
             logger.info(f"Successfully completed dataset processing for job {job_id}")
             
@@ -86,18 +116,16 @@ class DatasetProcessor:
         """Download and extract complete YOLO dataset archive."""
         try:
             logger.info(f"Downloading YOLO dataset archive from: {dataset_url}")
-            archive_data = await self.storage.download_file(dataset_url)
             
             # Create job-specific temporary directory
             temp_dir = Path(tempfile.mkdtemp(prefix=f"yolo_dataset_{job_id}_"))
             
-            # Save archive to temp file
+            # Stream archive to temp file (never held in memory)
             archive_path = temp_dir / "archive.zip"
-            archive_path.write_bytes(archive_data)
+            await self.storage.download_to_file(dataset_url, archive_path)
             
-            # Extract archive
-            with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
+            # Extract archive off the event loop
+            await asyncio.to_thread(_extract_zip, archive_path, temp_dir)
             
             # Remove the archive file
             archive_path.unlink()
@@ -150,59 +178,33 @@ class DatasetProcessor:
         logger.warning(f"Could not find dataset root structure in {extracted_dir}")
         return extracted_dir
     
-    async def _find_and_parse_annotations(self, extracted_dir: Path, config: YOLOConfig) -> Dict[str, List[YOLOAnnotation]]:
-        """Find and parse YOLO annotation files from the dataset."""
-        # Find the actual dataset root
-        dataset_root = self._find_dataset_root(extracted_dir)
-        
-        # Try multiple possible labels directory locations
-        possible_labels_dirs = [
-            dataset_root / "labels",
-            dataset_root / "train" / "labels",
-            dataset_root / "val" / "labels",
-        ]
-        
-        # Also search recursively for labels directories
-        possible_labels_dirs.extend(list(dataset_root.rglob("labels")))
-        
-        annotations = {}
-        
-        for labels_dir in possible_labels_dirs:
-            if labels_dir.exists() and labels_dir.is_dir():
-                logger.info(f"Processing labels from: {labels_dir}")
-                dir_annotations = await self._parse_yolo_annotations(labels_dir, config)
-                annotations.update(dir_annotations)
-        
+    def _validate_annotations(self, dataset_root: Path, annotations: Dict[str, List[YOLOAnnotation]]) -> None:
+        """Fail the import when no YOLO annotation files were parsed."""
         if not annotations:
-            # List directory structure for debugging
-            logger.error(f"Directory structure of {dataset_root}:")
-            for root, dirs, files in os.walk(dataset_root):
-                level = root.replace(str(dataset_root), '').count(os.sep)
-                indent = ' ' * 2 * level
-                logger.error(f"{indent}{os.path.basename(root)}/")
-                subindent = ' ' * 2 * (level + 1)
-                for file in files[:10]:  # Show only first 10 files
-                    logger.error(f"{subindent}{file}")
-                if len(files) > 10:
-                    logger.error(f"{subindent}... and {len(files) - 10} more files")
+            # List directory structure for debugging (walks the whole tree, so debug only)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Directory structure of {dataset_root}:")
+                for root, dirs, files in os.walk(dataset_root):
+                    level = root.replace(str(dataset_root), '').count(os.sep)
+                    indent = ' ' * 2 * level
+                    logger.debug(f"{indent}{os.path.basename(root)}/")
+                    subindent = ' ' * 2 * (level + 1)
+                    for file in files[:10]:  # Show only first 10 files
+                        logger.debug(f"{subindent}{file}")
+                    if len(files) > 10:
+                        logger.debug(f"{subindent}... and {len(files) - 10} more files")
             
-            raise ValidationError(f"No YOLO annotation files found in dataset. Searched directories: {[str(d) for d in possible_labels_dirs]}")
+            raise ValidationError(f"No YOLO annotation files found in dataset. Searched 'labels' directories under: {dataset_root}")
         
         logger.info(f"Successfully parsed annotations for {len(annotations)} images")
-        return annotations
     
-    async def _parse_yolo_annotations(self, labels_dir: Path, config: YOLOConfig) -> Dict[str, List[YOLOAnnotation]]:
-        """Parse YOLO annotation files from a specific labels directory."""
+    def _parse_yolo_annotations(self, label_files: List[Path], config: YOLOConfig) -> Dict[str, List[YOLOAnnotation]]:
+        """Parse YOLO annotation files (blocking; run in a worker thread)."""
         annotations = {}
         
-        # Find all .txt files in labels directory and subdirectories
-        label_files = list(labels_dir.rglob("*.txt"))
-        
-        if not label_files:
-            logger.warning(f"No .txt annotation files found in {labels_dir}")
-            return annotations
+        logger.info(f"Parsing {len(label_files)} annotation files")
         
-        logger.info(f"Parsing {len(label_files)} annotation files from {labels_dir}")
+        class_names = config.class_names
         
         for label_file in label_files:
             try:
@@ -210,19 +212,11 @@ class DatasetProcessor:
                 image_name = label_file.stem
                 
                 # Parse annotation file
-                file_annotations = []
-                with open(label_file, 'r') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        try:
-                            annotation = YOLOAnnotation.from_yolo_line(line, config.class_names)
-                            file_annotations.append(annotation)
-                        except ValueError as e:
-                            logger.warning(f"Invalid annotation in {label_file}:{line_num}: {e}")
-                            continue
+                file_annotations, errors = parse_yolo_annotations(
+                    label_file.read_text(), class_names
+                )
+                for line_num, error in errors:
+                    logger.warning(f"Invalid annotation in {label_file}:{line_num}: {error}")
                 
                 annotations[image_name] = file_annotations
                 
@@ -232,140 +226,166 @@ class DatasetProcessor:
         
         return annotations
     
-    async def _find_and_process_images(self, extracted_dir: Path, annotations: Dict[str, List[YOLOAnnotation]]) -> List[Dict[str, Any]]:
-        """Find and process image files from the dataset."""
-        # Find the actual dataset root
-        dataset_root = self._find_dataset_root(extracted_dir)
-        
-        # Try multiple possible images directory locations
-        possible_images_dirs = [
-            dataset_root / "images",
-            dataset_root / "train" / "images",
-            dataset_root / "val" / "images",
-        ]
-        
-        # Also search recursively for images directories
-        possible_images_dirs.extend(list(dataset_root.rglob("images")))
-        
+    async def _find_and_process_images(self, dataset_root: Path, image_files: Dict[Path, List[Path]],
+                                       annotations: AnnotationsFuture,
+                                       uploaded_paths: List[str]) -> List[Dict[str, Any]]:
+        """Process the image files found under the dataset's images directories."""
         images = []
-        image_extensions = ["*.jpg", "*.jpeg", "*.png", "*.bmp", "*.tiff"]
         
-        for images_dir in possible_images_dirs:
-            if images_dir.exists() and images_dir.is_dir():
-                logger.info(f"Processing images from: {images_dir}")
-                
-                # Find all image files
-                image_files = []
-                for ext in image_extensions:
-                    image_files.extend(list(images_dir.rglob(ext)))
-                    image_files.extend(list(images_dir.rglob(ext.upper())))
-                
-                if image_files:
-                    dir_images = await self._process_images_from_directory(images_dir, image_files, annotations)
-                    images.extend(dir_images)
+        for images_dir, dir_files in image_files.items():
+            logger.info(f"Processing images from: {images_dir}")
+            dir_images = await self._process_images_from_directory(
+                images_dir, dir_files, annotations, uploaded_paths
+            )
+            images.extend(dir_images)
         
         if not images:
-            raise ValidationError(f"No image files found in dataset. Searched directories: {[str(d) for d in possible_images_dirs]}")
+            raise ValidationError(f"No image files found in dataset. Searched 'images' directories under: {dataset_root}")
         
         logger.info(f"Successfully processed {len(images)} images")
         return images
     
     async def _process_images_from_directory(self, images_dir: Path, image_files: List[Path], 
-                                           annotations: Dict[str, List[YOLOAnnotation]]) -> List[Dict[str, Any]]:
-        """Process image files from a specific directory."""
+                                           annotations: AnnotationsFuture,
+                                           uploaded_paths: List[str]) -> List[Dict[str, Any]]:
+        """Process image files from a specific directory, uploading several at once."""
+        logger.info(f"Processing {len(image_files)} image files from {images_dir}")
+        
+        semaphore = asyncio.Semaphore(settings.image_upload_concurrency)
+        processed_at = datetime.now(timezone.utc)
+        
+        async def process_one(image_file: Path) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._process_image(
+                    images_dir, image_file, annotations, processed_at, uploaded_paths
+                )
+        
+        results = await asyncio.gather(
+            *(process_one(image_file) for image_file in image_files),
+            return_exceptions=True
+        )
+        
         images = []
+        for image_file, result in zip(image_files, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to process image {image_file.name}: {result}")
+            else:
+                images.append(result)
         
-        logger.info(f"Processing {len(image_files)} image files from {images_dir}")
+        return images
+    
+    async def _process_image(self, images_dir: Path, image_file: Path,
+                             annotations: AnnotationsFuture,
+                             processed_at: datetime,
+                             uploaded_paths: List[str]) -> Dict[str, Any]:
+        """
+        Read metadata for one image, upload it and build its record.
         
-        for image_file in image_files:
-            try:
-                # Get image metadata
-                with Image.open(image_file) as img:
-                    width, height = img.size
-                    format_name = img.format
-                
-                # Get file size
-                file_size = image_file.stat().st_size
-                
-                # Get filename without extension for annotation matching
-                image_name = image_file.stem
-                
-                # Get annotations for this image
-                image_annotations = annotations.get(image_name, [])
-                
-                # Store image file in storage
-                relative_path = image_file.relative_to(images_dir)
-                image_path = f"datasets/{image_name}/{relative_path}"
-                with open(image_file, 'rb') as f:
-                    image_data = f.read()
-                
-                image_url = await self.storage.upload_file(image_data, image_path)
-                
-                # Create image record
-                image_record = {
-                    "filename": image_file.name,
-                    "width": width,
-                    "height": height,
-                    "file_size_bytes": file_size,
-                    "image_url": image_url,
-                    "annotations": [
-                        {
-                            "class_id": ann.class_id,
-                            "class_name": ann.class_name,
-                            "bbox": {
-                                "center_x": ann.bbox.center_x,
-                                "center_y": ann.bbox.center_y,
-                                "width": ann.bbox.width,
-                                "height": ann.bbox.height
-                            }
-                        }
-                        for ann in image_annotations
-                    ],
-                    "annotation_count": len(image_annotations),
-                    "processed_at": datetime.utcnow()
+        The storage path is recorded in uploaded_paths before the upload starts
+        so a failed import can remove it.
+        """
+        # Get image metadata from the file header and its size, in a worker
+        # thread so slow filesystems don't stall the event loop
+        width, height, file_size = await asyncio.to_thread(_probe_image, image_file)
+        
+        # Get filename without extension for annotation matching
+        image_name = image_file.stem
+        
+        # Store image file in storage
+        relative_path = image_file.relative_to(images_dir)
+        image_path = f"datasets/{image_name}/{relative_path}"
+        uploaded_paths.append(image_path)
+        upload = asyncio.ensure_future(self.storage.upload_from_path(image_file, image_path))
+        try:
+            image_url = await asyncio.shield(upload)
+        except asyncio.CancelledError:
+            # The copy runs in a thread and can't be interrupted; let it finish
+            # so cleanup doesn't race a half-written file
+            await asyncio.gather(upload, return_exceptions=True)
+            raise
+        
+        # Get annotations for this image (waits for label parsing to finish)
+        image_annotations = (await annotations).get(image_name, [])
+        
+        # Create image record
+        return {
+            "filename": image_file.name,
+            "width": width,
+            "height": height,
+            "file_size_bytes": file_size,
+            "image_url": image_url,
+            "annotations": [
+                {
+                    "class_id": ann.class_id,
+                    "class_name": ann.class_name,
+                    "bbox": {
+                        "center_x": ann.bbox.center_x,
+                        "center_y": ann.bbox.center_y,
+                        "width": ann.bbox.width,
+                        "height": ann.bbox.height
+                    }
                 }
-                
-                images.append(image_record)
-                
-            except Exception as e:
-                logger.warning(f"Failed to process image {image_file.name}: {e}")
-                continue
+                for ann in image_annotations
+            ],
+            "annotation_count": len(image_annotations),
+            "processed_at": processed_at
+        }
+    
+    async def _delete_uploads(self, paths: List[str]) -> None:
+        """Best-effort removal of images uploaded by a failed import."""
+        if not paths:
+            return
         
-        return images
+        logger.info(f"Removing {len(paths)} uploaded images of failed import")
+        semaphore = asyncio.Semaphore(settings.image_upload_concurrency)
+        
+        async def delete_one(path: str) -> bool:
+            async with semaphore:
+                return await self.storage.delete_file(path)
+        
+        await asyncio.gather(*(delete_one(path) for path in paths), return_exceptions=True)
     
     async def _store_dataset(self, job_id: str, request_data: Dict[str, Any], 
-                           config: YOLOConfig, images: List[Dict[str, Any]], 
-                           annotations: Dict[str, List[YOLOAnnotation]]) -> str:
-        """Store dataset metadata and images in database."""
+                           config: YOLOConfig, images: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Store dataset metadata and images in database.
         
-        # Calculate dataset statistics
-        total_images = len(images)
-        total_annotations = sum(len(anns) for anns in annotations.values())
-        total_size = sum(img["file_size_bytes"] for img in images)
+        Statistics are computed once here from the stored image records and
+        returned with the dataset ID, so reads never re-aggregate images.
+        """
         
-        # Calculate class counts
-        class_counts = {name: 0 for name in config.class_names}
+        # Calculate dataset statistics in a single pass over the image records
+        # (class IDs were range-checked against the config when parsed)
+        total_images = len(images)
+        total_annotations = 0
+        total_size = 0
+        class_counts = [0] * len(config.class_names)
         for image in images:
+            total_annotations += image["annotation_count"]
+            total_size += image["file_size_bytes"]
             for annotation in image["annotations"]:
-                class_counts[annotation["class_name"]] += 1
+                class_counts[annotation["class_id"]] += 1
+        
+        stats = {
+            "total_images": total_images,
+            "total_annotations": total_annotations,
+            "classes_count": len(config.class_names),
+            "dataset_size_bytes": total_size,
+            "avg_annotations_per_image": total_annotations / total_images if total_images > 0 else 0
+        }
         
         # Create dataset record
+        now = datetime.now(timezone.utc)
         dataset_data = {
             "name": request_data["name"],
             "description": request_data.get("description"),
             "status": "completed",
-            "created_at": datetime.utcnow(),
-            "completed_at": datetime.utcnow(),
+            "created_at": now,
+            "completed_at": now,
             "import_job_id": job_id,
-            "stats": {
-                "total_images": total_images,
-                "total_annotations": total_annotations,
-                "classes_count": len(config.class_names),
-                "dataset_size_bytes": total_size,
-                "avg_annotations_per_image": total_annotations / total_images if total_images > 0 else 0
-            },
+            "stats": stats,
             "classes": [
-                {"id": i, "name": name, "count": class_counts.get(name, 0)}
+                {"id": i, "name": name, "count": class_counts[i]}
                 for i, name in enumerate(config.class_names)
             ],
             "storage": {
@@ -385,7 +405,7 @@ class DatasetProcessor:
         await self.db.create_images(images)
         
         logger.info(f"Stored dataset {dataset_id} with {total_images} images")
-        return dataset_id
+        return dataset_id, stats
     
     async def _update_progress(self, job_id: str, percentage: int, step: str, description: str) -> None:
         """Update job progress in database."""
@@ -401,18 +421,18 @@ class DatasetProcessor:
             logger.warning(f"Failed to update progress for job {job_id}: {e}")
     
     async def _complete_job(self, job_id: str, dataset_id: str, config: YOLOConfig, 
-                          images: List[Dict[str, Any]], annotations: Dict[str, List[YOLOAnnotation]]) -> None:
+                          stats: Dict[str, Any]) -> None:
         """Mark job as completed with summary."""
         summary = {
-            "total_images": len(images),
-            "total_annotations": sum(len(anns) for anns in annotations.values()),
+            "total_images": stats["total_images"],
+            "total_annotations": stats["total_annotations"],
             "classes": config.class_names,
-            "dataset_size_bytes": sum(img["file_size_bytes"] for img in images)
+            "dataset_size_bytes": stats["dataset_size_bytes"]
         }
         
         await self.db.update_import_job(job_id, {
             "status": "completed",
-            "completed_at": datetime.utcnow(),
+            "completed_at": datetime.now(timezone.utc),
             "dataset_id": dataset_id,
             "progress": {
                 "percentage": 100,
@@ -420,15 +440,159 @@ class DatasetProcessor:
             },
             "summary": summary
         })
+        await self._invalidate_job_status(job_id)
     
     async def _fail_job(self, job_id: str, error_message: str) -> None:
         """Mark job as failed with error details."""
+        now = datetime.now(timezone.utc)
         await self.db.update_import_job(job_id, {
             "status": "failed",
-            "completed_at": datetime.utcnow(),
+            "completed_at": now,
             "error": {
                 "code": "processing_error",
                 "message": error_message,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now.isoformat()
             }
         })
+        await self._invalidate_job_status(job_id)
+    
+    async def _invalidate_job_status(self, job_id: str) -> None:
+        """Drop the API's cached job status so the new status is visible immediately."""
+        if self.job_status_cache is not None:
+            await self.job_status_cache.invalidate(job_id)
+
+
+# Threads used to extract large archives (zlib inflate and file writes release the GIL)
+ZIP_EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+ZIP_PARALLEL_MIN_MEMBERS = 64
+
+
+def _extract_zip(archive_path: Path, destination: Path) -> None:
+    """Extract a ZIP archive into destination, in parallel for large archives."""
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        members = zip_ref.namelist()
+        if ZIP_EXTRACT_WORKERS == 1 or len(members) < ZIP_PARALLEL_MIN_MEMBERS:
+            zip_ref.extractall(destination)
+            return
+    
+    # Each worker opens its own handle so reads don't contend on one file position
+    slices = [members[i::ZIP_EXTRACT_WORKERS] for i in range(ZIP_EXTRACT_WORKERS)]
+    with ThreadPoolExecutor(max_workers=ZIP_EXTRACT_WORKERS) as pool:
+        list(pool.map(partial(_extract_members, archive_path, destination), slices))
+
+
+def _extract_members(archive_path: Path, destination: Path, names: List[str]) -> None:
+    """Extract the named members of a ZIP archive into destination."""
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        for name in names:
+            try:
+                zip_ref.extract(name, destination)
+            except FileExistsError:
+                # Another worker created the same parent directory concurrently
+                zip_ref.extract(name, destination)
+
+
+def _probe_image(path: Path) -> Tuple[int, int, int]:
+    """Return (width, height, file size in bytes) for an image file."""
+    width, height = _read_image_size(path)
+    return width, height, os.stat(path).st_size
+
+
+# JPEG start-of-frame markers (all SOFn except DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _read_image_size(path: Path) -> Tuple[int, int]:
+    """
+    Return (width, height) by parsing only the image header.
+    
+    PNG, JPEG and BMP are read directly; anything else (or a header that
+    can't be parsed) falls back to Pillow.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(26)
+        
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR" and len(head) >= 24:
+            width, height = struct.unpack(">II", head[16:24])
+            return width, height
+        
+        # BITMAPINFOHEADER and later (header size >= 40) store 32-bit dimensions;
+        # older OS/2 core headers are left to Pillow
+        if head.startswith(b"BM") and len(head) >= 26 and struct.unpack("<I", head[14:18])[0] >= 40:
+            width, height = struct.unpack("<ii", head[18:26])
+            return width, abs(height)
+        
+        if head.startswith(b"\xff\xd8"):
+            f.seek(2)
+            while True:
+                byte = f.read(1)
+                while byte and byte != b"\xff":
+                    byte = f.read(1)
+                while byte == b"\xff":
+                    byte = f.read(1)
+                if not byte:
+                    break
+                
+                marker = byte[0]
+                if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+                    continue  # standalone marker without a length field
+                
+                segment = f.read(2)
+                if len(segment) < 2:
+                    break
+                length = struct.unpack(">H", segment)[0]
+                if length < 2:
+                    break
+                
+                if marker in _JPEG_SOF_MARKERS:
+                    frame = f.read(5)
+                    if len(frame) < 5:
+                        break
+                    height, width = struct.unpack(">HH", frame[1:5])
+                    return width, height
+                
+                f.seek(length - 2, os.SEEK_CUR)
+    
+    with Image.open(path) as img:
+        return img.size
+
+
+# File extensions picked up as dataset images (matched case-insensitively)
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tiff"})
+
+
+def _index_dataset(dataset_root: Path) -> Tuple[List[Path], Dict[Path, List[Path]]]:
+    """
+    Walk the dataset tree once with os.scandir and classify every file.
+    
+    Returns the .txt files below any 'labels' directory, and the image files
+    below any 'images' directory grouped by their outermost 'images' directory.
+    """
+    label_files: List[Path] = []
+    image_files: Dict[Path, List[Path]] = {}
+    
+    # (directory, inside a labels directory, enclosing images directory)
+    stack = [(str(dataset_root), False, None)]
+    while stack:
+        directory, in_labels, images_dir = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((
+                        entry.path,
+                        in_labels or entry.name == "labels",
+                        images_dir or (Path(entry.path) if entry.name == "images" else None)
+                    ))
+                    continue
+                
+                extension = os.path.splitext(entry.name)[1].lower()
+                if in_labels and extension == ".txt":
+                    label_files.append(Path(entry.path))
+                elif images_dir is not None and extension in IMAGE_EXTENSIONS:
+                    image_files.setdefault(images_dir, []).append(Path(entry.path))
+    
+    label_files.sort()
+    for dir_files in image_files.values():
+        dir_files.sort()
+    
+    return label_files, image_files
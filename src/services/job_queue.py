@@ -3,13 +3,14 @@ Job queue service with environment-specific implementations.
 Handles background task processing for dataset imports.
 """
 
-import json
 import asyncio
+import orjson
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
 from src.config import settings, Environment, is_local_environment
+from src.models.api import ImportJobPayload
 from src.utils.logging import logger
 from src.utils.exceptions import ProcessingError
 
@@ -18,7 +19,7 @@ class JobQueue(ABC):
     """Abstract base class for job queue implementations."""
     
     @abstractmethod
-    async def enqueue_import_job(self, job_id: str, data: Dict[str, Any]) -> None:
+    async def enqueue_import_job(self, payload: ImportJobPayload) -> None:
         """Enqueue a dataset import job for background processing."""
         pass
     
@@ -53,20 +54,13 @@ class LocalJobQueue(JobQueue):
             logger.error(f"Failed to initialize local job queue: {e}")
             raise ProcessingError(f"Job queue initialization failed: {e}")
     
-    async def enqueue_import_job(self, job_id: str, data: Dict[str, Any]) -> None:
+    async def enqueue_import_job(self, payload: ImportJobPayload) -> None:
         """Enqueue import job using Celery."""
+        job_id = payload.job_id
         try:
             logger.info(f"Enqueueing import job {job_id} to Celery")
             
-            # Map API format to internal processing format
-            mapped_data = {
-                "name": data.get("name"),
-                "description": data.get("description"), 
-                "config_url": data.get("yolo_config_url"),
-                "dataset_url": data.get("dataset_url")
-            }
-            
-            result = self.task.delay(job_id, mapped_data)
+            result = self.task.delay(job_id, payload.to_dict())
             logger.info(f"Successfully enqueued job {job_id} with task ID: {result.id}")
             
         except Exception as e:
@@ -126,27 +120,19 @@ class ProductionJobQueue(JobQueue):
             logger.error(f"Failed to initialize production job queue: {e}")
             raise ProcessingError(f"Job queue initialization failed: {e}")
     
-    async def enqueue_import_job(self, job_id: str, data: Dict[str, Any]) -> None:
+    async def enqueue_import_job(self, payload: ImportJobPayload) -> None:
         """Enqueue import job using Cloud Tasks."""
+        job_id = payload.job_id
         try:
             logger.info(f"Enqueueing import job {job_id} to Cloud Tasks")
             
-            # Prepare task payload with mapped data
-            payload = {
-                "job_id": job_id,
-                "name": data.get("name"),
-                "description": data.get("description"),
-                "config_url": data.get("yolo_config_url"),
-                "dataset_url": data.get("dataset_url")
-            }
-            
             # Create Cloud Tasks task
             task = {
                 "http_request": {
                     "http_method": tasks_v2.HttpMethod.POST,
                     "url": f"{settings.worker_url}/process",
                     "headers": {"Content-Type": "application/json"},
-                    "body": json.dumps(payload).encode()
+                    "body": orjson.dumps(payload.to_dict())
                 },
                 "schedule_time": None  # Execute immediately
             }
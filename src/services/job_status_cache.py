@@ -0,0 +1,87 @@
+"""
+Redis-backed cache for import job status.
+Serves frequently polled job status reads without a MongoDB round-trip.
+"""
+
+from typing import Optional, Dict, Any
+
+import orjson
+
+from src.config import settings
+from src.utils.logging import logger
+
+
+class JobStatusCache:
+    """Short-lived Redis cache of import job documents keyed by job ID."""
+    
+    __slots__ = ("redis", "ttl_seconds")
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 3):
+        """Initialize cache with async Redis client."""
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(redis_url)
+        self.ttl_seconds = ttl_seconds
+        logger.info("Initialized job status cache (Redis)")
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        """Build Redis key for job."""
+        return f"job:{job_id}"
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return cached job document, or None on miss or Redis failure."""
+        try:
+            data = await self.redis.get(self._key(job_id))
+            return orjson.loads(data) if data else None
+        except Exception as e:
+            logger.debug(f"Job status cache read failed for {job_id}: {e}")
+            return None
+
+    async def set(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Cache job document; failures are logged and ignored."""
+        try:
+            await self.redis.set(
+                self._key(job_id),
+                orjson.dumps(job, default=str),
+                ex=self.ttl_seconds
+            )
+        except Exception as e:
+            logger.debug(f"Job status cache write failed for {job_id}: {e}")
+
+    async def invalidate(self, job_id: str) -> None:
+        """Drop cached job document."""
+        try:
+            await self.redis.delete(self._key(job_id))
+        except Exception as e:
+            logger.debug(f"Job status cache invalidation failed for {job_id}: {e}")
+
+    async def close(self) -> None:
+        """Close Redis connections."""
+        await self.redis.close()
+
+
+# Global job status cache instance
+_job_status_cache: Optional[JobStatusCache] = None
+
+
+def get_job_status_cache() -> Optional[JobStatusCache]:
+    """Get job status cache, or None when no Redis is configured."""
+    global _job_status_cache
+
+    if _job_status_cache is None and settings.redis_url:
+        _job_status_cache = JobStatusCache(
+            settings.redis_url,
+            ttl_seconds=settings.job_status_cache_ttl_seconds
+        )
+
+    return _job_status_cache
+
+
+async def close_job_status_cache() -> None:
+    """Close job status cache connections."""
+    global _job_status_cache
+
+    if _job_status_cache is not None:
+        await _job_status_cache.close()
+        _job_status_cache = None
@@ -3,10 +3,10 @@ Storage service with environment-specific implementations.
 Handles file operations for both local development and Cloud Storage.
 """
 
+import asyncio
 import os
 import shutil
 import aiofiles
-import aiohttp
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Union, Optional, AsyncIterator, Dict, Any
@@ -16,6 +16,9 @@ from src.config import settings, is_local_environment
 from src.utils.logging import logger
 from src.utils.exceptions import StorageError
 
+# Chunk size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class StorageService(ABC):
     """Abstract base class for storage implementations."""
@@ -25,11 +28,21 @@ class StorageService(ABC):
         """Upload file data and return URL."""
         pass
     
+    @abstractmethod
+    async def upload_from_path(self, source: Path, path: str) -> str:
+        """Upload a local file without reading it into memory and return URL."""
+        pass
+    
     @abstractmethod
     async def download_file(self, url: str) -> bytes:
         """Download file from URL and return data."""
         pass
     
+    @abstractmethod
+    async def download_to_file(self, url: str, destination: Path) -> None:
+        """Download file from URL straight to a local path without buffering it in memory."""
+        pass
+    
     @abstractmethod
     async def upload_stream(self, stream: AsyncIterator[bytes], path: str) -> str:
         """Upload file from async stream."""
@@ -84,6 +97,22 @@ class LocalStorageService(StorageService):
             logger.error(f"Failed to upload file to {path}: {e}")
             raise StorageError(f"Upload failed: {e}")
     
+    async def upload_from_path(self, source: Path, path: str) -> str:
+        """Copy a local file into local storage."""
+        try:
+            file_path = self._get_file_path(path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            await asyncio.to_thread(shutil.copyfile, source, file_path)
+            
+            url = f"file://{file_path.absolute()}"
+            logger.debug(f"Uploaded file to local storage: {url}")
+            return url
+            
+        except Exception as e:
+            logger.error(f"Failed to upload file to {path}: {e}")
+            raise StorageError(f"Upload failed: {e}")
+    
     async def download_file(self, url: str) -> bytes:
         """Download file from URL (local file or HTTP)."""
         try:
@@ -97,7 +126,8 @@ class LocalStorageService(StorageService):
                 return data
                 
             elif url.startswith(("http://", "https://")):
-                # HTTP URL - download from remote
+                # HTTP URL - download from remote (aiohttp is only needed by workers)
+                import aiohttp
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url) as response:
                         if response.status != 200:
@@ -113,6 +143,22 @@ class LocalStorageService(StorageService):
             logger.error(f"Failed to download file from {url}: {e}")
             raise StorageError(f"Download failed: {e}")
     
+    async def download_to_file(self, url: str, destination: Path) -> None:
+        """Download file from URL (local file or HTTP) to a local path."""
+        try:
+            if url.startswith("file://"):
+                await asyncio.to_thread(shutil.copyfile, url[7:], destination)
+            elif url.startswith(("http://", "https://")):
+                await _download_http_to_file(url, destination)
+            else:
+                raise StorageError(f"Unsupported URL scheme: {url}")
+            
+            logger.debug(f"Downloaded {url} to {destination}")
+            
+        except Exception as e:
+            logger.error(f"Failed to download file from {url}: {e}")
+            raise StorageError(f"Download failed: {e}")
+    
     async def upload_stream(self, stream: AsyncIterator[bytes], path: str) -> str:
         """Upload file from async stream."""
         try:
@@ -188,8 +234,8 @@ class ProductionStorageService(StorageService):
         try:
             blob = self.bucket.blob(path)
             
-            # Upload data
-            blob.upload_from_string(data)
+            # Upload data (the client is blocking, so keep it off the event loop)
+            await asyncio.to_thread(blob.upload_from_string, data)
             
             # Return gs:// URL
             url = f"gs://{self.bucket_name}/{path}"
@@ -200,6 +246,20 @@ class ProductionStorageService(StorageService):
             logger.error(f"Failed to upload file to {path}: {e}")
             raise StorageError(f"Upload failed: {e}")
     
+    async def upload_from_path(self, source: Path, path: str) -> str:
+        """Upload a local file to Cloud Storage (chunked by the client for large files)."""
+        try:
+            blob = self.bucket.blob(path)
+            await asyncio.to_thread(blob.upload_from_filename, str(source))
+            
+            url = f"gs://{self.bucket_name}/{path}"
+            logger.debug(f"Uploaded file to Cloud Storage: {url}")
+            return url
+            
+        except Exception as e:
+            logger.error(f"Failed to upload file to {path}: {e}")
+            raise StorageError(f"Upload failed: {e}")
+    
     async def download_file(self, url: str) -> bytes:
         """Download file from URL (Cloud Storage or HTTP)."""
         try:
@@ -219,7 +279,8 @@ class ProductionStorageService(StorageService):
                 return data
                 
             elif url.startswith(("http://", "https://")):
-                # HTTP URL - download from remote
+                # HTTP URL - download from remote (aiohttp is only needed by workers)
+                import aiohttp
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url) as response:
                         if response.status != 200:
@@ -235,6 +296,24 @@ class ProductionStorageService(StorageService):
             logger.error(f"Failed to download file from {url}: {e}")
             raise StorageError(f"Download failed: {e}")
     
+    async def download_to_file(self, url: str, destination: Path) -> None:
+        """Download file from URL (Cloud Storage or HTTP) to a local path."""
+        try:
+            if url.startswith("gs://"):
+                parsed = urlparse(url)
+                blob = self.client.bucket(parsed.netloc).blob(parsed.path.lstrip("/"))
+                await asyncio.to_thread(blob.download_to_filename, str(destination))
+            elif url.startswith(("http://", "https://")):
+                await _download_http_to_file(url, destination)
+            else:
+                raise StorageError(f"Unsupported URL scheme: {url}")
+            
+            logger.debug(f"Downloaded {url} to {destination}")
+            
+        except Exception as e:
+            logger.error(f"Failed to download file from {url}: {e}")
+            raise StorageError(f"Download failed: {e}")
+    
     async def upload_stream(self, stream: AsyncIterator[bytes], path: str) -> str:
         """Upload file from async stream to Cloud Storage."""
         try:
@@ -286,6 +365,19 @@ class ProductionStorageService(StorageService):
             return 0
 
 
+async def _download_http_to_file(url: str, destination: Path) -> None:
+    """Stream an HTTP response body to disk in fixed-size chunks."""
+    import aiohttp
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise StorageError(f"HTTP {response.status}: {response.reason}")
+            
+            async with aiofiles.open(destination, "wb") as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
+
+
 # Global storage service instance
 _storage_service: Optional[StorageService] = None
 
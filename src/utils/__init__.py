@@ -3,7 +3,8 @@ Utility modules for YOLO Dataset Management API.
 Provides logging, exception handling, and common utilities.
 """
 
-from .logging import logger, setup_logging
+from .logging import logger, setup_logging, stop_logging
+from .cache import TTLCache
 from .exceptions import (
     YOLODatasetError,
     ProcessingError,
@@ -15,6 +16,8 @@ from .exceptions import (
 __all__ = [
     "logger",
     "setup_logging",
+    "stop_logging",
+    "TTLCache",
     "YOLODatasetError",
     "ProcessingError", 
     "ValidationError",
@@ -3,7 +3,11 @@ Structured logging configuration for YOLO Dataset Management API.
 Provides consistent, production-ready logging across the application.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 import json
 from datetime import datetime
@@ -78,6 +82,35 @@ class LocalFormatter(logging.Formatter):
         return message
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers all formatting to the listener thread."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message args but keep exc_info for the real formatter."""
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener that writes queued records to the real handlers
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_queue_handler: Optional[_InProcessQueueHandler] = None
+_console_handler: Optional[logging.Handler] = None
+
+
+def _start_listener() -> None:
+    """Point the queue handler at a fresh queue and start a listener draining it."""
+    global _log_listener
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    _log_queue_handler.queue = log_queue
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, _console_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+
+
 def setup_logging() -> None:
     """Configure logging for the application."""
     
@@ -85,6 +118,7 @@ def setup_logging() -> None:
     root_logger = logging.getLogger()
     
     # Clear existing handlers
+    stop_logging()
     root_logger.handlers.clear()
     
     # Set log level based on configuration
@@ -102,7 +136,14 @@ def setup_logging() -> None:
         formatter = StructuredFormatter()
     
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    # Log calls only enqueue records; formatting and stdout writes happen on
+    # the listener thread so they don't block the event loop
+    global _log_queue_handler, _console_handler
+    _console_handler = console_handler
+    _log_queue_handler = _InProcessQueueHandler(queue.Queue(-1))
+    root_logger.addHandler(_log_queue_handler)
+    _start_listener()
     
     # Configure specific loggers
     
@@ -119,6 +160,30 @@ def setup_logging() -> None:
     app_logger.info(f"Logging configured - Level: {settings.log_level}, Environment: {settings.environment}")
 
 
+def stop_logging() -> None:
+    """Flush queued log records, stop the listener and log directly from then on."""
+    global _log_listener, _log_queue_handler
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+        
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(_log_queue_handler)
+        root_logger.addHandler(_console_handler)
+        _log_queue_handler = None
+
+
+def _restart_listener_after_fork() -> None:
+    """Start a listener in forked children (e.g. Celery prefork), which don't inherit threads."""
+    if _log_listener is not None:
+        _start_listener()
+
+
+atexit.register(stop_logging)
+os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
 # Application logger instance
 logger = logging.getLogger("yolo_dataset_api")
 
@@ -14,6 +14,7 @@ from src.config import settings, Environment
 from src.models.api import ImportJobData
 from src.services.dataset_processor import DatasetProcessor
 from src.services.database import init_database, get_database
+from src.services.job_status_cache import get_job_status_cache
 from src.utils.logging import setup_logging, logger
 from src.utils.exceptions import ProcessingError
 
@@ -145,6 +146,7 @@ async def process_dataset_import(job_id: str, data: Dict[str, Any]) -> None:
                 "total_steps": 5
             }
         })
+        await invalidate_job_status(job_id)
         
         # Process the dataset import
         await processor.process_dataset_import(job_id, data)
@@ -166,6 +168,7 @@ async def process_dataset_import(job_id: str, data: Dict[str, Any]) -> None:
                 "total_steps": 5
             }
         })
+        await invalidate_job_status(job_id)
         
         logger.info(f"Successfully completed dataset import {job_id}")
         
@@ -188,10 +191,18 @@ async def mark_job_failed(job_id: str, error_message: str) -> None:
                 "timestamp": datetime.utcnow().isoformat()
             }
         })
+        await invalidate_job_status(job_id)
     except Exception as e:
         logger.error(f"Failed to update job status for {job_id}: {e}")
 
 
+async def invalidate_job_status(job_id: str) -> None:
+    """Drop the API's cached status for a job whose status just changed."""
+    cache = get_job_status_cache()
+    if cache is not None:
+        await cache.invalidate(job_id)
+
+
 # For direct execution (production worker)
 if __name__ == "__main__":
     if settings.environment == Environment.PRODUCTION:
@@ -7,20 +7,22 @@ and health checks with proper async testing, mocking, and error handling.
 
 import pytest
 import asyncio
+import base64
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from unittest.mock import patch, AsyncMock, MagicMock
 from httpx import AsyncClient
 from fastapi import status
 from fastapi.testclient import TestClient
-from bson import ObjectId
+from bson import ObjectId, json_util
 
 from src.main import app
 from src.models.api import ImportRequest, ImportResponse, JobStatusResponse
 from src.models.database import Dataset, ImportJob, Image
-from src.utils.exceptions import DatabaseError, ProcessingError
-from src.services.database import get_database
+from src.utils.exceptions import DatabaseError, ProcessingError, ValidationError
+from src.services.database import get_database, _apply_cursor, _encode_cursor
 from src.services.job_queue import get_job_queue
+from src.services.job_status_cache import get_job_status_cache
 
 
 @pytest.fixture
@@ -63,6 +65,17 @@ def mock_database_service():
     return mock
 
 
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Reset in-process response caches between tests."""
+    from src.api.datasets import _dataset_cache
+    from src.api.health import _health_cache
+    
+    _dataset_cache.clear()
+    _health_cache.clear()
+    yield
+
+
 @pytest.fixture
 def mock_job_queue():
     """Mock job queue service."""
@@ -72,7 +85,15 @@ def mock_job_queue():
 
 
 @pytest.fixture
-async def test_client(mock_database_service, mock_job_queue):
+def mock_job_status_cache():
+    """Mock job status cache (always misses by default)."""
+    mock = AsyncMock()
+    mock.get.return_value = None
+    return mock
+
+
+@pytest.fixture
+async def test_client(mock_database_service, mock_job_queue, mock_job_status_cache):
     """Test client with properly mocked dependencies."""
     
     def override_get_database():
@@ -81,9 +102,13 @@ async def test_client(mock_database_service, mock_job_queue):
     def override_get_job_queue():
         return mock_job_queue
     
+    def override_get_job_status_cache():
+        return mock_job_status_cache
+    
     # Override FastAPI dependencies
     app.dependency_overrides[get_database] = override_get_database
     app.dependency_overrides[get_job_queue] = override_get_job_queue
+    app.dependency_overrides[get_job_status_cache] = override_get_job_status_cache
     
     try:
         async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -224,6 +249,16 @@ class TestDatasetImport:
         mock_database_service.create_import_job.assert_called_once()
         mock_job_queue.enqueue_import_job.assert_called_once()
 
+    def test_job_ids_unique_across_pool_refills(self):
+        """Test pooled job IDs are unique version 4 UUIDs."""
+        import uuid
+        from src.api.import_jobs import _next_job_id, JOB_ID_POOL_SIZE
+        
+        job_ids = [_next_job_id() for _ in range(JOB_ID_POOL_SIZE * 2 + 1)]
+        
+        assert len(set(job_ids)) == len(job_ids)
+        assert all(uuid.UUID(job_id).version == 4 for job_id in job_ids)
+
     async def test_import_valid_request_optional_description(
         self,
         test_client: AsyncClient,
@@ -354,6 +389,39 @@ class TestJobStatus:
         assert data["progress"]["percentage"] == 0
         assert "estimated_completion" in data
 
+    async def test_get_job_status_cached(
+        self,
+        test_client: AsyncClient,
+        mock_database_service: AsyncMock,
+        mock_job_status_cache: AsyncMock
+    ):
+        """Test job status is served from cache without a database read."""
+        job_id = "550e8400-e29b-41d4-a716-446655440000"
+        
+        mock_job_status_cache.get.return_value = {
+            "job_id": job_id,
+            "status": "processing",
+            "progress": {
+                "percentage": 40,
+                "current_step": "parsing_annotations",
+                "steps_completed": ["download", "extract"],
+                "total_steps": 6
+            },
+            "started_at": "2025-07-03T10:00:00",
+            "completed_at": None,
+            "estimated_completion": "2025-07-03T10:20:00"
+        }
+        
+        response = await test_client.get(f"/datasets/import/{job_id}/status")
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        
+        assert data["status"] == "processing"
+        assert data["progress"]["percentage"] == 40
+        mock_database_service.get_import_job.assert_not_called()
+        mock_job_status_cache.set.assert_not_called()
+
     async def test_get_job_status_processing(
         self,
         test_client: AsyncClient,
@@ -568,7 +636,7 @@ class TestDatasetListing:
         assert data["pagination"]["page"] == page
         assert data["pagination"]["limit"] == limit
 
-    @pytest.mark.parametrize("status_filter", ["completed", "processing", "failed", "queued"])
+    @pytest.mark.parametrize("status_filter", ["completed", "failed"])
     async def test_list_datasets_status_filtering(
         self,
         test_client: AsyncClient,
@@ -587,6 +655,17 @@ class TestDatasetListing:
         call_kwargs = mock_database_service.list_datasets.call_args[1]
         assert call_kwargs["status"] == status_filter
 
+    @pytest.mark.parametrize("status_filter", ["processing", "queued"])
+    async def test_list_datasets_rejects_job_only_statuses(
+        self,
+        test_client: AsyncClient,
+        status_filter: str
+    ):
+        """Test dataset listing rejects statuses datasets are never stored with."""
+        response = await test_client.get(f"/datasets?status={status_filter}")
+        
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     @pytest.mark.parametrize("sort_by,sort_order", [
         ("created_at", "desc"),
         ("created_at", "asc"),
@@ -622,11 +701,79 @@ class TestDatasetListing:
             response = await test_client.get(f"/datasets{params}")
             assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
+    async def test_list_datasets_cursor_pagination(
+        self,
+        test_client: AsyncClient,
+        mock_database_service: AsyncMock
+    ):
+        """Test dataset listing passes the keyset cursor to the database service."""
+        response = await test_client.get("/datasets?cursor=abc123")
+        
+        assert response.status_code == status.HTTP_200_OK
+        call_kwargs = mock_database_service.list_datasets.call_args[1]
+        assert call_kwargs["cursor"] == "abc123"
+
+    async def test_list_datasets_invalid_cursor(
+        self,
+        test_client: AsyncClient,
+        mock_database_service: AsyncMock
+    ):
+        """Test dataset listing with a malformed cursor."""
+        mock_database_service.list_datasets.side_effect = ValidationError(
+            "Invalid pagination cursor", field="cursor"
+        )
+        
+        response = await test_client.get("/datasets?cursor=not-a-cursor")
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cursor_rejects_non_scalar_values(self):
+        """Test forged cursors cannot inject operators into the keyset query."""
+        def encode(payload):
+            return base64.urlsafe_b64encode(json_util.dumps(payload).encode()).decode()
+        
+        forged = [
+            [{"$where": "sleep(1000)"}, str(ObjectId())],
+            [{"$where": "sleep(1000)"}, 1],
+            ["traffic", {"$gt": ""}],
+            [["a"], {"$oid": str(ObjectId())}],
+            [123, {"$oid": str(ObjectId())}],
+        ]
+        
+        for payload in forged:
+            with pytest.raises(ValidationError):
+                _apply_cursor({}, encode(payload), "name", 1)
+
+    def test_cursor_round_trip_and_null_sort_values(self):
+        """Test cursors from _encode_cursor resume after the last document."""
+        last_id = ObjectId()
+        
+        cursor = _encode_cursor({"_id": last_id, "name": "traffic"}, "name")
+        query = _apply_cursor({"status": "completed"}, cursor, "name", -1)
+        assert query["status"] == "completed"
+        assert query["$or"] == [
+            {"name": {"$lt": "traffic"}},
+            {"name": "traffic", "_id": {"$lt": last_id}},
+            {"name": None}
+        ]
+        
+        cursor = _encode_cursor({"_id": last_id}, "completed_at")
+        query = _apply_cursor({}, cursor, "completed_at", 1)
+        assert query["$or"] == [
+            {"completed_at": None, "_id": {"$gt": last_id}},
+            {"completed_at": {"$ne": None}}
+        ]
+
     async def test_list_datasets_invalid_sort_order(self, test_client: AsyncClient):
         """Test dataset listing with invalid sort order."""
         response = await test_client.get("/datasets?sort_order=invalid")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
+    async def test_list_datasets_invalid_sort_field(self, test_client: AsyncClient):
+        """Test dataset listing rejects sort fields outside the allowed set."""
+        response = await test_client.get("/datasets?sort_by=$where")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     async def test_list_datasets_database_error(
         self,
         test_client: AsyncClient,
@@ -665,6 +812,42 @@ class TestDatasetDetails:
         assert "classes" in data
         assert "storage" in data
 
+    async def test_get_dataset_cached(
+        self,
+        test_client: AsyncClient,
+        mock_database_service: AsyncMock,
+        sample_dataset_data: Dict[str, Any]
+    ):
+        """Test repeated dataset lookups are served from cache."""
+        dataset_id = "507f1f77bcf86cd799439011"
+        mock_database_service.get_dataset.return_value = sample_dataset_data
+        
+        first = await test_client.get(f"/datasets/{dataset_id}")
+        second = await test_client.get(f"/datasets/{dataset_id}")
+        
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json()["name"] == sample_dataset_data["name"]
+        assert "max-age" in second.headers["cache-control"]
+        mock_database_service.get_dataset.assert_called_once()
+
+    async def test_get_dataset_in_progress_not_cached(
+        self,
+        test_client: AsyncClient,
+        mock_database_service: AsyncMock,
+        sample_dataset_data: Dict[str, Any]
+    ):
+        """Test datasets still being imported are always read fresh."""
+        dataset_id = "507f1f77bcf86cd799439011"
+        mock_database_service.get_dataset.return_value = {**sample_dataset_data, "status": "processing"}
+        
+        first = await test_client.get(f"/datasets/{dataset_id}")
+        second = await test_client.get(f"/datasets/{dataset_id}")
+        
+        assert first.status_code == status.HTTP_200_OK
+        assert second.headers["cache-control"] == "no-cache"
+        assert mock_database_service.get_dataset.call_count == 2
+
     async def test_get_dataset_not_found(
         self,
         test_client: AsyncClient,
@@ -753,6 +936,81 @@ class TestDatasetImages:
         assert "annotations" in image
         assert "annotation_count" in image
 
+    async def test_list_images_response_compressed(
+        self,
+        test_client: AsyncClient,
+        mock_database_service: AsyncMock,
+        sample_image_data: list
+    ):
+        """Test large image listings are gzip-compressed."""
+        dataset_id = "507f1f77bcf86cd799439011"
+        
+        mock_database_service.list_dataset_images.return_value = {
+            "dataset_id": dataset_id,
+            "images": sample_image_data * 25,
+            "pagination": {
+                "page": 1,
+                "limit": 50,
+                "total_pages": 1,
+                "total_items": 50,
+                "has_next": False,
+                "has_prev": False
+            },
+            "filters_applied": {
+                "class_filter": None,
+                "has_annotations": None
+            }
+        }
+        
+        response = await test_client.get(
+            f"/datasets/{dataset_id}/images",
+            headers={"Accept-Encoding": "gzip"}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["images"]) == 50
+
+    async def test_list_images_compact_format(
+        self,
+        test_client: AsyncClient,
+        mock_database_service: AsyncMock,
+        sample_image_data: list
+    ):
+        """Test compact format returns positional rows with field order."""
+        dataset_id = "507f1f77bcf86cd799439011"
+        
+        mock_database_service.list_dataset_images.return_value = {
+            "dataset_id": dataset_id,
+            "images": sample_image_data,
+            "pagination": {
+                "page": 1,
+                "limit": 50,
+                "total_pages": 1,
+                "total_items": 2,
+                "has_next": False,
+                "has_prev": False
+            },
+            "filters_applied": {
+                "class_filter": None,
+                "has_annotations": None
+            }
+        }
+        
+        response = await test_client.get(f"/datasets/{dataset_id}/images?format=compact")
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        
+        image_fields = data["fields"]["image"]
+        annotation_fields = data["fields"]["annotation"]
+        row = data["images"][0]
+        
+        assert row[image_fields.index("filename")] == "traffic_001.jpg"
+        annotation = row[image_fields.index("annotations")][0]
+        assert annotation[annotation_fields.index("class_name")] == "car"
+        assert annotation[annotation_fields.index("center_x")] == 0.5
+
     async def test_list_images_empty_dataset(
         self,
         test_client: AsyncClient,
@@ -925,11 +1183,14 @@ class TestDatasetImages:
     ):
         """Test listing images for non-existent dataset."""
         dataset_id = "507f1f77bcf86cd799439011"
-        mock_database_service.get_dataset.return_value = None
+        mock_database_service.list_dataset_images.return_value = None
         
         response = await test_client.get(f"/datasets/{dataset_id}/images")
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
+        
+        # Existence is resolved by the images query, no separate dataset lookup
+        mock_database_service.get_dataset.assert_not_called()
 
     async def test_list_images_invalid_pagination(
         self,
@@ -1001,8 +1262,12 @@ class TestHealthCheck:
 
     async def test_health_check_exception_handling(self, test_client: AsyncClient):
         """Test health check with exception during health checks."""
-        with patch('src.api.health.health_check_database') as mock_db_health:
+        with patch('src.api.health.health_check_database') as mock_db_health, \
+             patch('src.api.health.health_check_queue') as mock_queue_health, \
+             patch('src.api.health.health_check_storage') as mock_storage_health:
             mock_db_health.side_effect = Exception("Unexpected error")
+            mock_queue_health.return_value = {"status": "healthy"}
+            mock_storage_health.return_value = {"status": "healthy"}
             
             response = await test_client.get("/health")
         
@@ -1011,6 +1276,11 @@ class TestHealthCheck:
         
         assert data["status"] == "unhealthy"
         assert "errors" in data
+        
+        # Remaining probes still run and report their own status
+        assert data["dependencies"]["mongodb"] == "unhealthy"
+        assert data["dependencies"]["job_queue"] == "healthy"
+        assert data["dependencies"]["storage"] == "healthy"
 
 
 class TestConcurrentRequests:
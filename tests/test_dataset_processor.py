@@ -0,0 +1,296 @@
+"""
+Dataset processor tests.
+Tests the import pipeline's concurrency and cleanup, dataset indexing, archive
+extraction and header-only image size parsing.
+"""
+
+import asyncio
+import io
+import struct
+import threading
+import zipfile
+from pathlib import Path
+from unittest.mock import patch, AsyncMock, MagicMock
+
+import pytest
+from PIL import Image, UnidentifiedImageError
+
+from src.config import settings
+from src.models.yolo import YOLOConfig
+from src.services.dataset_processor import DatasetProcessor, _extract_zip, _index_dataset, _read_image_size
+from src.utils.exceptions import ProcessingError, StorageError
+
+
+def _write_image(path: Path, size=(64, 48), format_name: str = "PNG") -> Path:
+    """Save a solid-color image of the given size and format."""
+    Image.new("RGB", size, (255, 0, 0)).save(path, format=format_name)
+    return path
+
+
+@pytest.fixture
+def processor():
+    """Dataset processor with mocked storage and database services."""
+    storage = MagicMock()
+    storage.delete_file = AsyncMock(return_value=True)
+    with patch("src.services.dataset_processor.get_storage_service", return_value=storage), \
+         patch("src.services.dataset_processor.get_database", return_value=AsyncMock()), \
+         patch("src.services.dataset_processor.get_job_status_cache", return_value=None):
+        yield DatasetProcessor()
+
+
+def _make_dataset(root: Path, count: int) -> Path:
+    """Create a minimal extracted dataset with count images and labels."""
+    (root / "images").mkdir(parents=True)
+    (root / "labels").mkdir()
+    for i in range(count):
+        _write_image(root / "images" / f"img_{i:03d}.png", (8, 8))
+        (root / "labels" / f"img_{i:03d}.txt").write_text("0 0.5 0.5 0.2 0.2\n")
+    return root
+
+
+class TestImportPipeline:
+    """Test the overlapped label parsing and image upload pipeline."""
+
+    async def test_parse_failure_cancels_and_awaits_uploads(self, processor, tmp_path: Path):
+        """Test a label parsing failure stops in-flight uploads and removes uploaded images."""
+        dataset_dir = _make_dataset(tmp_path / "dataset", 4)
+        upload_started = threading.Event()
+        finished_uploads = []
+        image_task_state = {}
+        
+        async def upload_from_path(source: Path, path: str) -> str:
+            upload_started.set()
+            await asyncio.sleep(0.05)
+            finished_uploads.append(path)
+            return f"local://{path}"
+        
+        def parse_labels(label_files, config):
+            upload_started.wait(5)
+            raise ProcessingError("corrupt labels")
+        
+        original_find_and_process = processor._find_and_process_images
+        
+        async def find_and_process_images(*args):
+            try:
+                return await original_find_and_process(*args)
+            except asyncio.CancelledError:
+                image_task_state["cancelled"] = True
+                raise
+            finally:
+                image_task_state["finished_uploads"] = len(finished_uploads)
+        
+        processor.storage.upload_from_path = upload_from_path
+        processor._download_and_parse_config = AsyncMock(return_value=YOLOConfig(names=["car"]))
+        processor._download_and_extract_dataset = AsyncMock(return_value=dataset_dir)
+        processor._parse_yolo_annotations = parse_labels
+        processor._find_and_process_images = find_and_process_images
+        
+        with pytest.raises(ProcessingError, match="corrupt labels"):
+            await processor.process_dataset_import("job-1", {
+                "config_url": "local://dataset.yaml",
+                "dataset_url": "local://dataset.zip"
+            })
+        
+        # The image task was cancelled and had settled before the import failed
+        assert image_task_state["cancelled"] is True
+        assert "finished_uploads" in image_task_state
+        
+        # Every started upload finished before cleanup and was deleted afterwards
+        deleted = [call.args[0] for call in processor.storage.delete_file.call_args_list]
+        assert finished_uploads
+        assert set(finished_uploads) <= set(deleted)
+        processor.db.update_import_job.assert_called()
+        assert processor.db.update_import_job.call_args[0][1]["status"] == "failed"
+
+
+    async def test_upload_concurrency_bounded_and_failures_isolated(self, processor, tmp_path: Path):
+        """Test uploads never exceed the configured concurrency and one failure keeps the rest."""
+        dataset_dir = _make_dataset(tmp_path / "dataset", 12)
+        image_files = sorted((dataset_dir / "images").iterdir())
+        uploads = {"active": 0, "peak": 0}
+        
+        async def upload_from_path(source: Path, path: str) -> str:
+            uploads["active"] += 1
+            uploads["peak"] = max(uploads["peak"], uploads["active"])
+            try:
+                await asyncio.sleep(0.01)
+                if source.name == "img_005.png":
+                    raise StorageError("upload failed")
+                return f"local://{path}"
+            finally:
+                uploads["active"] -= 1
+        
+        processor.storage.upload_from_path = upload_from_path
+        annotations = asyncio.get_running_loop().create_future()
+        annotations.set_result({})
+        
+        with patch.object(settings, "image_upload_concurrency", 3):
+            images = await processor._process_images_from_directory(
+                dataset_dir / "images", image_files, annotations, []
+            )
+        
+        assert uploads["peak"] == 3
+        assert len(images) == 11
+        assert "img_005.png" not in {image["filename"] for image in images}
+        assert all(image["width"] == 8 and image["height"] == 8 for image in images)
+
+
+class TestIndexDataset:
+    """Test the single-pass dataset tree index."""
+
+    def test_labels_and_images_are_classified_and_paired(self, tmp_path: Path):
+        """Test nested directories, mixed-case extensions and unmatched labels."""
+        files = [
+            "images/train/a.jpg",
+            "images/train/B.PNG",
+            "images/train/notes.md",
+            "images/train/stray.txt",
+            "images/val/c.Jpeg",
+            "images/val/deep/images/d.bmp",
+            "labels/train/a.txt",
+            "labels/train/B.txt",
+            "labels/val/c.txt",
+            "labels/val/orphan.txt",
+            "labels/readme.md",
+            "other/e.jpg",
+        ]
+        for name in files:
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"")
+        
+        label_files, image_files = _index_dataset(tmp_path)
+        
+        assert label_files == sorted(tmp_path / name for name in (
+            "labels/train/a.txt", "labels/train/B.txt", "labels/val/c.txt", "labels/val/orphan.txt"
+        ))
+        # Images are grouped under their outermost 'images' directory
+        assert image_files == {tmp_path / "images": sorted(tmp_path / name for name in (
+            "images/train/a.jpg", "images/train/B.PNG", "images/val/c.Jpeg", "images/val/deep/images/d.bmp"
+        ))}
+        
+        # Labels pair with images by file stem; unmatched labels are left over
+        image_stems = {path.stem for path in image_files[tmp_path / "images"]}
+        paired = {path.stem for path in label_files if path.stem in image_stems}
+        assert paired == {"a", "B", "c"}
+
+
+class TestExtractZip:
+    """Test archive extraction."""
+
+    def test_parallel_extraction_matches_extractall(self, tmp_path: Path):
+        """Test the threaded path extracts the same tree as a serial extractall."""
+        archive_path = tmp_path / "archive.zip"
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for i in range(80):
+                subdir = "images" if i % 2 else "labels"
+                archive.writestr(f"dataset/{subdir}/split_{i % 3}/file_{i:03d}.dat", f"member {i}" * 50)
+        
+        # Fail the first extraction with FileExistsError, as when two workers
+        # create the same parent directory at once
+        original_extract = zipfile.ZipFile.extract
+        retried = []
+        lock = threading.Lock()
+        
+        def flaky_extract(self, member, path=None, pwd=None):
+            with lock:
+                first = not retried
+                retried.append(member)
+            if first:
+                raise FileExistsError(member)
+            return original_extract(self, member, path, pwd)
+        
+        parallel_dir = tmp_path / "parallel"
+        with patch("src.services.dataset_processor.ZIP_EXTRACT_WORKERS", 4), \
+             patch.object(zipfile.ZipFile, "extract", flaky_extract):
+            _extract_zip(archive_path, parallel_dir)
+        
+        serial_dir = tmp_path / "serial"
+        with zipfile.ZipFile(archive_path) as archive:
+            archive.extractall(serial_dir)
+        
+        def tree(root: Path):
+            return {
+                path.relative_to(root): path.read_bytes()
+                for path in root.rglob("*") if path.is_file()
+            }
+        
+        assert len(retried) == 81
+        assert tree(parallel_dir) == tree(serial_dir)
+        assert len(tree(parallel_dir)) == 80
+
+
+class TestReadImageSize:
+    """Test image dimensions are read from file headers."""
+
+    @pytest.mark.parametrize("format_name", ["PNG", "JPEG", "BMP"])
+    def test_header_formats(self, tmp_path: Path, format_name: str):
+        """Test PNG, JPEG and BMP sizes match Pillow."""
+        path = _write_image(tmp_path / f"image.{format_name.lower()}", (640, 480), format_name)
+        
+        width, height = _read_image_size(path)
+        
+        assert (width, height) == (640, 480)
+
+    def test_progressive_jpeg(self, tmp_path: Path):
+        """Test JPEG start-of-frame is found after other segments."""
+        path = tmp_path / "progressive.jpg"
+        Image.new("RGB", (123, 45)).save(path, format="JPEG", progressive=True, dpi=(72, 72))
+        
+        width, height = _read_image_size(path)
+        
+        assert (width, height) == (123, 45)
+
+    def test_os2_bitmap_core_header(self, tmp_path: Path):
+        """Test BMPs with a 12-byte OS/2 header use 16-bit dimensions."""
+        width, height = 3, 2
+        row = b"\x00\x00\xff" * width + b"\x00" * 3
+        pixels = row * height
+        offset = 14 + 12
+        
+        path = tmp_path / "os2.bmp"
+        path.write_bytes(
+            b"BM" + struct.pack("<IHHI", offset + len(pixels), 0, 0, offset)
+            + struct.pack("<IHHHH", 12, width, height, 1, 24)
+            + pixels
+        )
+        
+        assert _read_image_size(path) == (3, 2)
+
+    def test_png_truncated_after_header(self, tmp_path: Path):
+        """Test a PNG with a complete IHDR still reports its size."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (32, 16)).save(buffer, format="PNG")
+        path = tmp_path / "cut.png"
+        path.write_bytes(buffer.getvalue()[:40])
+        
+        assert _read_image_size(path) == (32, 16)
+
+    @pytest.mark.parametrize("format_name", ["GIF", "TIFF"])
+    def test_other_formats_fall_back_to_pillow(self, tmp_path: Path, format_name: str):
+        """Test formats without a header fast path are sized by Pillow."""
+        path = _write_image(tmp_path / f"image.{format_name.lower()}", (77, 33), format_name)
+        
+        assert _read_image_size(path) == (77, 33)
+
+    def test_jpeg_without_frame_header_falls_back_to_pillow(self, tmp_path: Path):
+        """Test a JPEG whose SOF can't be found in the header is handed to Pillow."""
+        path = tmp_path / "cut.jpg"
+        path.write_bytes(b"\xff\xd8\xff\xe0\x00")
+        
+        with pytest.raises(UnidentifiedImageError):
+            _read_image_size(path)
+
+    @pytest.mark.parametrize("content, error", [
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\x0dIHDR", "Truncated File Read"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\x0dIHDR\x00\x00", "Truncated File Read"),
+        (b"BM\x00\x00", "cannot identify image file"),
+        (b"", "cannot identify image file"),
+    ])
+    def test_truncated_files_raise_pillow_errors(self, tmp_path: Path, content: bytes, error: str):
+        """Test truncated headers are handed to Pillow, which reports the file as unreadable."""
+        path = tmp_path / "truncated"
+        path.write_bytes(content)
+        
+        with pytest.raises(OSError, match=error):
+            _read_image_size(path)
@@ -9,9 +9,9 @@ from typing import Dict, Any
 from pydantic import ValidationError
 from bson import ObjectId
 
-from src.models.api import ImportRequest, ImportResponse, DatasetListResponse
+from src.models.api import ImportRequest, ImportResponse, DatasetListResponse, ImportJobData, ImportJobPayload
 from src.models.database import Dataset, ImportJob, Image
-from src.models.yolo import YOLOConfig, YOLOBoundingBox, YOLOAnnotation
+from src.models.yolo import YOLOConfig, YOLOBoundingBox, YOLOAnnotation, parse_yolo_annotations
 
 
 class TestAPIModels:
@@ -72,6 +72,28 @@ class TestAPIModels:
         assert response.status == "queued"
         assert isinstance(response.created_at, datetime)
 
+    def test_import_job_payload_from_request(self):
+        """Test queue payload maps request fields to worker format."""
+        request = ImportRequest(
+            name="Test Dataset",
+            yolo_config_url="https://example.com/config.yaml",
+            dataset_url="https://example.com/dataset.zip"
+        )
+        
+        payload = ImportJobPayload.from_request("job-123", request)
+        
+        assert payload.to_dict() == {
+            "job_id": "job-123",
+            "name": "Test Dataset",
+            "description": None,
+            "config_url": "https://example.com/config.yaml",
+            "dataset_url": "https://example.com/dataset.zip"
+        }
+        ImportJobData(**payload.to_dict())  # Worker accepts the same shape
+        
+        with pytest.raises(AttributeError):
+            payload.name = "Other"
+
 
 class TestDatabaseModels:
     """Test database models with actual MongoDB structure."""
@@ -262,6 +284,13 @@ names:
         assert config.nc == 3
         assert config.class_names == ["car", "truck", "bus"]
         assert config.path == "/datasets/traffic"
+        
+        # Identical content reuses the parsed (frozen) config
+        assert YOLOConfig.from_yaml(yaml_content) is config
+        
+        # Mutating the returned class names must not leak into the cached config
+        config.class_names.append("tram")
+        assert YOLOConfig.from_yaml(yaml_content).class_names == ["car", "truck", "bus"]
 
     def test_yolo_config_validation_errors(self):
         """Test YOLOConfig validation failures."""
@@ -305,6 +334,30 @@ names:
         with pytest.raises(ValueError):
             YOLOAnnotation.from_yolo_line("0 0.5", class_names)
 
+    def test_parse_yolo_annotations_bulk(self):
+        """Test parsing a whole label file with per-line error reporting."""
+        text = "0 0.5 0.6 0.3 0.4\n\n1 0.1 0.2 0.3 0.4 0.9\n5 0.5 0.5 0.3 0.4\n0 1.5 0.5 0.3 0.4\n"
+        
+        annotations, errors = parse_yolo_annotations(text, ["car", "truck"])
+        
+        assert [a.class_name for a in annotations] == ["car", "truck"]
+        assert annotations[1].confidence == 0.9
+        assert annotations[1].bbox.center_y == 0.2
+        assert [line_num for line_num, _ in errors] == [4, 5]
+
+    def test_parse_yolo_annotations_gapped_names(self):
+        """Test class IDs missing from dict-style names are rejected."""
+        config = YOLOConfig(names={0: "a", 2: "c"})
+        text = "0 0.5 0.5 0.1 0.1\n1 0.5 0.5 0.1 0.1\n2 0.5 0.5 0.1 0.1\n"
+        
+        annotations, errors = parse_yolo_annotations(text, config.class_names)
+        
+        assert [a.class_name for a in annotations] == ["a", "c"]
+        assert [line_num for line_num, _ in errors] == [2]
+        
+        with pytest.raises(ValueError):
+            YOLOAnnotation.from_yolo_line("1 0.5 0.5 0.1 0.1", config.class_names)
+
     def test_coordinate_conversion_methods(self):
         """Test bounding box coordinate conversion."""
         bbox = YOLOBoundingBox(
@@ -327,6 +380,7 @@ names:
         assert xyxy["y1"] == 144  # 240 - 96
         assert xyxy["x2"] == 416  # 320 + 96
         assert xyxy["y2"] == 336  # 240 + 96
+        assert bbox.to_xyxy_tuple(640, 480) == (224, 144, 416, 336)
 
 
 class TestCriticalEdgeCases: